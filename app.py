@@ -1,195 +1,176 @@
 import streamlit as st
-from io import BytesIO
-import qrcode
-import base64
-import json
-import requests
 from datetime import datetime
 import uuid
-# Lottie optional - will only be used if installed
-try:
-    from streamlit_lottie import st_lottie
-except Exception:
-    st_lottie = None
-
-PRESETS_FILE = "presets.json"
+from functools import partial
+from renderer import QR_FILENAME, QR_FORMATS, TEMPLATES, generate_markdown, qr_file
+from lottie_assets import loader as lottie_loader
+from github_import import RANKINGS, GitHubImportError, import_profile
+from preset_store import PRESETS_DB, PRESETS_FILE, PresetStore
+from profiler import profiler
+from profile_model import Profile, ProfileError
+# qrcode, requests, the link checker, local assets and the bundle writer are
+# imported where their feature is used, so a new replica's first page only
+# pays for what it shows
 
 # -------------------- Helpers --------------------
-def load_presets():
+@st.cache_resource
+def get_preset_store():
+    return PresetStore(PRESETS_DB, migrate_from=PRESETS_FILE)
+
+@st.cache_resource
+def get_link_checker():
+    # shared by all sessions, so its TTL cache and connection pool are too
+    from link_checker import LinkChecker
+    return LinkChecker()
+
+@st.cache_resource
+def get_st_lottie():
+    # Lottie optional - will only be used if installed
     try:
-        with open(PRESETS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
-
-def save_presets(presets):
-    with open(PRESETS_FILE, "w", encoding="utf-8") as f:
-        json.dump(presets, f, indent=2, ensure_ascii=False)
-
-def badge_md(name):
-    from urllib.parse import quote_plus
-    safe = quote_plus(name)
-    return f"![{name}](https://img.shields.io/badge/{safe}-informational?style=for-the-badge&logo={safe}&logoColor=white)"
-
-def make_qr_png(url, box_size=10, border=2):
-    qr = qrcode.QRCode(box_size=box_size, border=border)
-    qr.add_data(url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color='black', back_color='white')
-    buf = BytesIO()
-    img.save(buf, format='PNG')
-    buf.seek(0)
-    return buf
-
-def download_bytes_button(data_bytes, filename, label):
-    b64 = base64.b64encode(data_bytes).decode()
-    href = f'<a href="data:application/octet-stream;base64,{b64}" download="{filename}">{label}</a>'
-    st.markdown(href, unsafe_allow_html=True)
-
-def load_lottie_url(url):
-    try:
-        r = requests.get(url, timeout=8)
-        if r.status_code == 200:
-            return r.json()
+        from streamlit_lottie import st_lottie
     except Exception:
         return None
-    return None
-
-def generate_markdown(data, template="clean-minimal", include_qr=False, qr_filename=None):
-    lines = []
-    name = data.get("name","Your Name")
-    title = data.get("title","")
-    about = data.get("about","")
-    socials = data.get("socials",[])
-    tech = data.get("tech",[])
-    education = data.get("education","")
-    cpi = data.get("cpi","")
-    certs = data.get("certifications",[])
-    projects = data.get("projects",[])
-    objective = data.get("objective","")
-    phone = data.get("phone","")
-    email = data.get("email","")
-    linkedin = data.get("linkedin","")
-    github = data.get("github","")
-
-    if template == "clean-minimal":
-        lines.append(f"# {name}")
-        if title: lines.append(f"**{title}**")
-        lines.append("\n---\n")
-        if about: lines.append(about + "\n")
-        if socials:
-            badges = []
-            for s in socials:
-                label = s.get('label','Link')
-                url = s.get('url','')
-                if url:
-                    badges.append(f"[{label}]({url})")
-            if badges:
-                lines.append(" | ".join(badges) + "\n")
-        if tech:
-            lines.append("\n**Tech:**\n")
-            lines.append(" ".join([badge_md(t) for t in tech]) + "\n")
-        if projects:
-            lines.append("\n---\n\n## Projects\n")
-            for p in projects:
-                lines.append(f"### {p.get('name')}\n")
-                if p.get("tags"): lines.append(f"*{p.get('tags')}*  \n")
-                if p.get("links"):
-                    for l in p.get("links"):
-                        if l.strip():
-                            lines.append(f"[Repo / Link]({l})  \n")
-                if p.get("desc"): lines.append(p.get("desc") + "\n")
-        lines.append("\n---\n")
-        lines.append("Contact:  \n")
-        if email: lines.append(f"- Email: {email}")
-        if phone: lines.append(f"- Phone: {phone}")
-        if github: lines.append(f"- GitHub: {github}")
-        return "\n".join(lines)
-
-    if template == "fancy-animated":
-        lines.append(f"# 👋 Hi, I'm **{name}**")
-        if title: lines.append(f"### {title}")
-        lines.append("\n---\n")
-        if about: lines.append(about + "\n")
-        # social badges
-        social_badges = []
-        for s in socials:
-            label = s.get('label','Link').lower()
-            url = s.get('url','')
-            if url:
-                if 'instagram' in label:
-                    social_badges.append(f"[![Instagram](https://img.shields.io/badge/Instagram-%23E4405F.svg?logo=Instagram&logoColor=white)]({url})")
-                elif 'linkedin' in label:
-                    social_badges.append(f"[![LinkedIn](https://img.shields.io/badge/LinkedIn-%230077B5.svg?logo=linkedin&logoColor=white)]({url})")
-                elif 'email' in label:
-                    social_badges.append(f"[![email](https://img.shields.io/badge/Email-D14836?logo=gmail&logoColor=white)](mailto:{url})")
-                else:
-                    social_badges.append(f"[{s.get('label')}]({url})")
-        if social_badges:
-            lines.append(" ".join(social_badges) + "\n")
-
-        gh = (github or "").strip().rstrip("/").split("/")[-1] if github else ""
-        if gh:
-            lines.append("\n---\n\n## 📊 GitHub Highlights\n")
-            lines.append(f"![](https://github-readme-stats.vercel.app/api?username={gh}&show_icons=true&theme=radical&count_private=true)\n")
-            lines.append(f"![](https://github-readme-stats.vercel.app/api/top-langs/?username={gh}&layout=compact&theme=radical)\n")
-            lines.append(f"![](https://github-readme-streak-stats.herokuapp.com/?user={gh}&theme=radical)\n")
-
-        if tech:
-            lines.append("\n---\n\n# 💻 Tech Stack\n")
-            lines.append(" ".join([badge_md(t) for t in tech]) + "\n")
-
-        if projects:
-            lines.append("\n---\n\n# 🚀 Selected Projects\n")
-            for p in projects:
-                lines.append(f"### 🔹 {p.get('name')}  \n")
-                if p.get("tags"): lines.append(f"**Category:** {p.get('tags')}  \n")
-                if p.get("links"):
-                    for l in p.get("links"):
-                        if l.strip():
-                            lines.append(f"[Link]({l})  \n")
-                if p.get("desc"): lines.append(p.get("desc") + "  \n")
-                lines.append("\n")
-        if include_qr and qr_filename:
-            lines.append("\n---\n")
-            lines.append(f"## 🔗 Portfolio QR  \n![]({qr_filename})  \n")
-        lines.append("\n---\n")
-        lines.append("Contact & Links  \n")
-        if email: lines.append(f"- Email: {email}  ")
-        if linkedin: lines.append(f"- LinkedIn: {linkedin}  ")
-        if github: lines.append(f"- GitHub: {github}  ")
-        return "\n".join(lines)
-
-    if template == "resume-style":
-        lines.append(f"# {name} \n**{title}**\n")
-        lines.append("---\n")
-        if about: lines.append(f"**Profile:** {about}\n")
-        if tech:
-            lines.append("\n**Skills:**\n")
-            lines.append(", ".join(tech) + "\n")
-        if education:
-            lines.append("\n**Education:**\n")
-            lines.append(f"- {education} (CPI: {cpi})\n")
-        if certs:
-            lines.append("\n**Certifications:**\n")
-            for c in certs:
-                lines.append(f"- {c}\n")
-        if projects:
-            lines.append("\n**Projects:**\n")
-            for p in projects:
-                links_str = ", ".join([l for l in p.get('links',[]) if l.strip()])
-                lines.append(f"- **{p.get('name')}** — {p.get('desc')} ({links_str})\n")
-        lines.append("\n**Contact:**\n")
-        if email: lines.append(f"- Email: {email}\n")
-        if phone: lines.append(f"- Phone: {phone}\n")
-        if linkedin: lines.append(f"- LinkedIn: {linkedin}\n")
-        if github: lines.append(f"- GitHub: {github}\n")
-        return "\n".join(lines)
-
-    return "\n".join(lines)
+    return st_lottie
+
+def save_preset(name, profile):
+    get_preset_store().put(name, profile.to_dict())
+    # lets Quick Save tell that nothing changed since
+    st.session_state['saved_preset'] = (profile.digest, name)
+
+def export_presets(store):
+    from io import BytesIO
+    from preset_io import export_jsonl
+    buf = BytesIO()
+    export_jsonl(store, buf)
+    return buf.getvalue()
+
+def build_bundle(*args):
+    from bundle import bundle_bytes
+    return bundle_bytes(*args)
+
+PAGE_SIZE = 10
+
+def forget_widgets(*prefixes):
+    # widgets are keyed by list index, so after a remove or a reload their
+    # stored values would land on the wrong row
+    for key in [k for k in st.session_state if isinstance(k, str) and k.startswith(prefixes)]:
+        del st.session_state[key]
+
+def reset_table(name):
+    # data_editor keeps edits as deltas against the rows it was first given,
+    # so replacing the list underneath it needs a fresh widget
+    st.session_state[f'{name}_rev'] = st.session_state.get(f'{name}_rev', 0) + 1
+    st.session_state.pop(f'{name}_base', None)
+
+def switch_editor(table, prefix):
+    # the other editor may have changed the list since these widgets last ran
+    reset_table(table)
+    forget_widgets(prefix)
+
+def table_editor(name, rows, column_config):
+    # pandas/pyarrow only load once someone opens a table editor
+    import pandas as pd
+    base_key = f'{name}_base'
+    if base_key not in st.session_state:
+        st.session_state[base_key] = pd.DataFrame(rows, columns=list(column_config))
+    edited = st.data_editor(st.session_state[base_key], key=f"{name}_{st.session_state.get(f'{name}_rev', 0)}",
+                            column_config=column_config, num_rows='dynamic', hide_index=True, width='stretch')
+    return [{k: (v if isinstance(v, str) else '') for k, v in row.items()} for row in edited.to_dict('records')]
+
+def social_rows(socials):
+    for i, s in enumerate(socials):
+        cols = st.columns([2,5,1])
+        lbl = cols[0].text_input(f'Label {i+1}', value=s.get('label',''), key=f's_label_{i}')
+        url = cols[1].text_input(f'URL {i+1}', value=s.get('url',''), key=f's_url_{i}')
+        cols[2].button('Remove', key=f's_rem_{i}', on_click=remove_social, args=(socials, i))
+        socials[i] = {'label': lbl, 'url': url}
+    st.button('Add Social', on_click=socials.append, args=({'label':'New','url':''},))
+
+def social_table(socials):
+    rows = table_editor('socials_table', socials, {
+        'label': st.column_config.TextColumn('Label'),
+        'url': st.column_config.TextColumn('URL', width='large'),
+    })
+    socials[:] = [r for r in rows if r['label'] or r['url']]
+
+@st.fragment
+def socials_editor():
+    mode = st.radio('Social links (label + url)', ('Rows', 'Table'), horizontal=True, key='socials_mode',
+                    on_change=switch_editor, args=('socials_table', 's_'))
+    with run.stage('socials_widgets'):
+        if mode == 'Table':
+            social_table(st.session_state['form_socials'])
+        else:
+            social_rows(st.session_state['form_socials'])
+
+# structural edits run as callbacks, before the fragment re-renders
+def remove_social(socials, i):
+    socials.pop(i)
+    forget_widgets('s_')
+
+def remove_project(projects, i):
+    projects.pop(i)
+    forget_widgets('p_')
+
+def remove_link(links, i, j):
+    links.pop(j)
+    forget_widgets(f'p_{i}_link')
+
+def add_project(projects):
+    projects.append({'name':'New Project','links':[''],'tags':'','desc':''})
+    st.session_state['projects_page'] = max(1, -(-len(projects) // PAGE_SIZE))
+
+def project_cards(projects):
+    pages = max(1, -(-len(projects) // PAGE_SIZE))
+    if st.session_state.get('projects_page', 1) > pages:
+        st.session_state['projects_page'] = pages
+    page = st.number_input(f'Page (of {pages})', min_value=1, max_value=pages, key='projects_page') if pages > 1 else 1
+    start = (page - 1) * PAGE_SIZE
+    for i in range(start, min(start + PAGE_SIZE, len(projects))):
+        proj = projects[i]
+        st.markdown(f'**Project #{i+1}**', unsafe_allow_html=True)
+        pcols = st.columns([3,1])
+        pname = pcols[0].text_input(f'Name {i}', value=proj.get('name',''), key=f'p_name_{i}')
+        pcols[1].button('Remove', key=f'p_rem_{i}', on_click=remove_project, args=(projects, i))
+        # links editor
+        links = proj.get('links',[])
+        for j, link in enumerate(links):
+            lcols = st.columns([8,1])
+            links[j] = lcols[0].text_input(f'Link {i}.{j}', value=link, key=f'p_{i}_link_{j}')
+            lcols[1].button('x', key=f'p_{i}_linkrem_{j}', on_click=remove_link, args=(links, i, j))
+        st.button(f'Add link to project {i+1}', key=f'addlink_{i}', on_click=links.append, args=('',))
+        ptags = st.text_input(f'Tags {i}', value=proj.get('tags',''), key=f'p_tags_{i}')
+        pdesc = st.text_area(f'Description {i}', value=proj.get('desc',''), key=f'p_desc_{i}', height=80)
+        # write back
+        projects[i] = {'name':pname, 'links':links, 'tags':ptags, 'desc':pdesc}
+    st.button('Add Project', on_click=add_project, args=(projects,))
+
+def project_table(projects):
+    rows = table_editor('projects_table', [dict(p, links=' '.join(p.get('links', []))) for p in projects], {
+        'name': st.column_config.TextColumn('Name'),
+        'links': st.column_config.TextColumn('Links (space-separated)', width='large'),
+        'tags': st.column_config.TextColumn('Tags'),
+        'desc': st.column_config.TextColumn('Description', width='large'),
+    })
+    projects[:] = [dict(r, links=r['links'].split()) for r in rows if any(r.values())]
+
+@st.fragment
+def projects_editor():
+    # edits here rerun only this fragment; the preview catches up on the
+    # next full rerun (any widget outside the editor, or the button below)
+    mode = st.radio('Project editor', ('Cards', 'Table'), horizontal=True, key='projects_mode',
+                    on_change=switch_editor, args=('projects_table', 'p_'))
+    with run.stage('project_widgets'):
+        if mode == 'Table':
+            project_table(st.session_state['projects'])
+        else:
+            project_cards(st.session_state['projects'])
+    if st.button('Update preview', key='projects_update_preview'):
+        st.rerun()
 
 # -------------------- Streamlit UI --------------------
 st.set_page_config(page_title='README Maker Final', layout='wide', initial_sidebar_state='expanded')
+run = profiler.run()
 
 # Themed animated header CSS
 dark_mode = st.sidebar.checkbox('Dark Mode', value=True)
@@ -234,87 +215,79 @@ st.markdown('<p class="muted">Add multiple projects, URLs, socials; save presets
 # Sidebar: templates, presets, import
 with st.sidebar:
     st.header('Options & Presets')
-    template = st.selectbox('Template', ['clean-minimal','fancy-animated','resume-style'])
+    template = st.selectbox('Template', TEMPLATES)
     include_qr = st.checkbox('Generate QR code', value=True)
+    qr_format = st.radio('QR format', QR_FORMATS, horizontal=True, format_func=str.upper,
+                         help='SVG scales to any size and is the smaller file')
+    local_assets = st.checkbox('Render badges & stats locally (SVG files)', value=False, key='local_assets',
+                               help='No shields.io / stats-service requests when the README is viewed; '
+                                    'download the bundle and commit it as-is.')
     st.markdown('---')
     st.subheader('Presets')
-    presets = load_presets()
-    preset_names = ['<select>'] + list(presets.keys())
+    with run.stage('presets'):
+        presets = get_preset_store()
+        preset_names = ['<select>'] + presets.names()
     selected_preset = st.selectbox('Load preset', preset_names)
     if st.button('Load preset') and selected_preset != '<select>':
-        st.session_state['loaded_preset'] = presets[selected_preset]
-        st.rerun()
+        try:
+            # also repairs presets saved with tech/certs as raw text
+            st.session_state['loaded_preset'] = Profile.from_dict(presets.get(selected_preset)).to_dict()
+            st.rerun()
+        except ProfileError as e:
+            st.error(f'Preset {selected_preset} is invalid — {e}')
     st.text_input('Preset name to save', key='preset_name_input')
     if st.button('Save preset'):
         name_key = st.session_state.get('preset_name_input','').strip() or f'preset-{uuid.uuid4().hex[:6]}'
-        presets[name_key] = {
-            'name': st.session_state.get('form_name', 'Your Name'),
-            'title': st.session_state.get('form_title',''),
-            'about': st.session_state.get('form_about',''),
-            'socials': st.session_state.get('form_socials',[]),
-            'tech': st.session_state.get('form_tech',[]),
-            'education': st.session_state.get('form_education',''),
-            'cpi': st.session_state.get('form_cpi',''),
-            'certifications': st.session_state.get('form_certs',[]),
-            'projects': st.session_state.get('projects',[]),
-            'github': st.session_state.get('form_github',''),
-            'phone': st.session_state.get('form_phone',''),
-            'email': st.session_state.get('form_email',''),
-            'linkedin': st.session_state.get('form_linkedin','')
-        }
-        save_presets(presets)
-        st.success(f'Preset saved as {name_key}')
+        try:
+            save_preset(name_key, Profile.from_state(st.session_state))
+            st.success(f'Preset saved as {name_key}')
+        except ProfileError as e:
+            st.error(f'Not saved — {e}')
     if st.button('Delete preset'):
         key = st.session_state.get('preset_name_input','').strip()
-        if key and key in presets:
-            presets.pop(key)
-            save_presets(presets)
+        if key and presets.delete(key):
             st.success(f'Deleted {key}')
+    with st.expander('Bulk import / export (JSONL)'):
+        upload = st.file_uploader('Profiles, one JSON object per line', type=['jsonl'], key='bulk_upload')
+        if upload is not None and st.button('Import presets'):
+            from preset_io import import_jsonl
+            bad = []
+            with st.spinner('Importing...'):
+                stats = import_jsonl(upload, presets, workers=0,
+                                     on_error=lambda lineno, message: bad.append({'line': lineno, 'error': message}))
+            st.session_state['bulk_report'] = (stats, bad[:200])
+            st.rerun()  # refresh the preset list above
+        if st.session_state.get('bulk_report'):
+            stats, bad = st.session_state['bulk_report']
+            st.success(f"Imported {stats['imported']} presets in {stats['seconds']:.1f}s")
+            if stats['failed']:
+                st.warning(f"{stats['failed']} line(s) skipped" + (' (first 200 shown)' if stats['failed'] > 200 else ''))
+                st.dataframe(bad, hide_index=True)
+        st.download_button('Export all presets (.jsonl)', partial(export_presets, presets), file_name='presets.jsonl',
+                           mime='application/jsonl', on_click='ignore')
     st.markdown('---')
     st.subheader('GitHub Import')
     gh_username = st.text_input('GitHub username', value='')
     gh_token = st.text_input('GitHub token (optional)', value='', type='password')
+    gh_rank = st.selectbox('Pick projects by', list(RANKINGS), key='gh_rank')
+    gh_max_projects = st.number_input('Projects to import', min_value=1, max_value=100, value=8, key='gh_max_projects')
     if st.button('Import from GitHub'):
-        headers = {'Accept': 'application/vnd.github.v3+json'}
-        if gh_token:
-            headers['Authorization'] = f'token {gh_token}'
+        import requests
         try:
-            if not gh_username:
-                st.error('Enter a GitHub username to import.')
-            else:
-                u = requests.get(f'https://api.github.com/users/{gh_username}', headers=headers, timeout=10)
-                r = requests.get(f'https://api.github.com/users/{gh_username}/repos?per_page=100&sort=pushed', headers=headers, timeout=10)
-                if u.status_code == 200:
-                    user = u.json()
-                    imported = {
-                        'name': user.get('name') or user.get('login') or '',
-                        'title': user.get('bio') or '',
-                        'about': user.get('bio') or '',
-                        'socials': [],
-                        'tech': [],
-                        'education': '',
-                        'cpi': '',
-                        'certifications': [],
-                        'projects': []
-                    }
-                    repos = r.json() if r.status_code==200 else []
-                    for repo in repos[:8]:
-                        imported['projects'].append({
-                            'name': repo.get('name'),
-                            'links': [repo.get('html_url')],
-                            'tags': repo.get('language') or '',
-                            'desc': repo.get('description') or ''
-                        })
-                    st.session_state['loaded_preset'] = imported
-                    st.success('Imported GitHub profile & top repos into the form.')
-                    st.rerun()
-                else:
-                    st.error('GitHub import failed — check username or rate limits.')
-        except Exception as e:
+            st.session_state['loaded_preset'] = import_profile(
+                gh_username.strip(), token=gh_token or None,
+                rank_by=gh_rank, max_projects=int(gh_max_projects))
+            st.success('Imported GitHub profile, languages & top repos into the form.')
+            st.rerun()
+        except GitHubImportError as e:
+            st.error(str(e))
+        except requests.RequestException as e:
             st.error(f'Import error: {e}')
 
 # Use loaded preset if present
 preset = st.session_state.get('loaded_preset', None)
+if preset:
+    st.session_state['github_stats'] = preset.get('github_stats', {})
 
 # Main form layout
 col1, col2 = st.columns([2,1])
@@ -331,21 +304,11 @@ with col1:
             {'label':'LinkedIn','url':''},
             {'label':'Email','url':'your-email@example.com'}
         ])
+        reset_table('socials_table')
+        forget_widgets('s_')
         st.session_state['loaded_preset'] = None
 
-    st.write('Social links (label + url)')
-    for i, s in enumerate(st.session_state['form_socials']):
-        cols = st.columns([2,5,1])
-        lbl = cols[0].text_input(f'Label {i+1}', value=s.get('label',''), key=f's_label_{i}')
-        url = cols[1].text_input(f'URL {i+1}', value=s.get('url',''), key=f's_url_{i}')
-        rem = cols[2].button('Remove', key=f's_rem_{i}')
-        st.session_state['form_socials'][i] = {'label': lbl, 'url': url}
-        if rem:
-            st.session_state['form_socials'].pop(i)
-            st.rerun()
-    if st.button('Add Social'):
-        st.session_state['form_socials'].append({'label':'New','url':''})
-        st.rerun()
+    socials_editor()
 
     st.markdown('---')
     st.subheader('Education & Certs')
@@ -360,107 +323,84 @@ with col2:
     # Projects management (dynamic)
     if 'projects' not in st.session_state or st.session_state.get('loaded_preset'):
         st.session_state['projects'] = (preset or {}).get('projects', [])
+        reset_table('projects_table')
+        forget_widgets('p_')
         st.session_state['loaded_preset'] = None
 
     # Lottie animation for projects sidebar (if available)
+    st_lottie = get_st_lottie()
     if st_lottie:
-        lottie_projects = load_lottie_url('https://assets7.lottiefiles.com/packages/lf20_touohxv0.json')
+        with run.stage('lottie_projects'):
+            lottie_projects = lottie_loader.get_named('projects')
         if lottie_projects:
             try:
                 st_lottie(lottie_projects, height=120, key='lottie_projects_side')
             except Exception:
                 pass
 
-    if st.button('Add Project'):
-        st.session_state['projects'].append({'name':'New Project','links':[''],'tags':'','desc':''})
-        st.rerun()
-
-    # Display projects with ability to add/remove links per project
-    remove_indices = []
-    for i, proj in enumerate(st.session_state['projects']):
-        st.markdown(f'**Project #{i+1}**', unsafe_allow_html=True)
-        pcols = st.columns([3,1])
-        pname = pcols[0].text_input(f'Name {i}', value=proj.get('name',''), key=f'p_name_{i}')
-        prem = pcols[1].button('Remove', key=f'p_rem_{i}')
-        if prem:
-            remove_indices.append(i)
-        # links editor
-        links = proj.get('links',[])
-        for j, link in enumerate(links):
-            lcols = st.columns([8,1])
-            linkv = lcols[0].text_input(f'Link {i}.{j}', value=link, key=f'p_{i}_link_{j}')
-            lrem = lcols[1].button('x', key=f'p_{i}_linkrem_{j}')
-            links[j] = linkv
-            if lrem:
-                links.pop(j)
-                st.rerun()
-        if st.button(f'Add link to project {i+1}', key=f'addlink_{i}'):
-            links.append('')
-            st.rerun()
-        ptags = st.text_input(f'Tags {i}', value=proj.get('tags',''), key=f'p_tags_{i}')
-        pdesc = st.text_area(f'Description {i}', value=proj.get('desc',''), key=f'p_desc_{i}', height=80)
-        # write back
-        st.session_state['projects'][i] = {'name':pname, 'links':links, 'tags':ptags, 'desc':pdesc}
-    # remove after loop to avoid index shift issues
-    if remove_indices:
-        for idx in sorted(remove_indices, reverse=True):
-            st.session_state['projects'].pop(idx)
-        st.rerun()
+    projects_editor()
 
 # Buttons to reorder or clear
 pc1, pc2, pc3 = st.columns(3)
 if pc1.button('Clear All Projects'):
     st.session_state['projects'] = []
+    reset_table('projects_table')
+    forget_widgets('p_')
     st.rerun()
 if pc2.button('Load Example Projects'):
     st.session_state['projects'] = [
         {'name':'Example Project','links':[''],'tags':'Example','desc':'A sample project entry.'}
     ]
+    reset_table('projects_table')
+    forget_widgets('p_')
     st.rerun()
 
+if pc3.button('Check links'):
+    try:
+        profile = Profile.from_state(st.session_state)
+        with st.spinner('Checking links...'):
+            st.session_state['link_report'] = get_link_checker().check_profile(profile.to_dict())
+    except ProfileError as e:
+        st.error(f'Links not checked — {e}')
+link_report = st.session_state.get('link_report')
+if link_report is not None:
+    broken = sum(1 for _, _, r in link_report if r['state'] == 'broken')
+    if broken:
+        st.warning(f'{broken} broken link(s) as of the last check')
+    else:
+        st.success(f'All {len(link_report)} links reachable as of the last check')
+    state_icons = {'ok': '✅', 'broken': '❌', 'unverified': '❔'}
+    st.dataframe([
+        {'': state_icons[r['state']], 'where': where, 'url': url, 'result': str(r['status'] or r['error'])}
+        for where, url, r in link_report
+    ], hide_index=True)
+
 # Quick Save Preset
 if st.button('Quick Save Preset (auto name)'):
-    presets = load_presets()
-    key = f'preset-{uuid.uuid4().hex[:6]}'
-    presets[key] = {
-        'name': st.session_state.get('form_name',''),
-        'title': st.session_state.get('form_title',''),
-        'about': st.session_state.get('form_about',''),
-        'socials': st.session_state.get('form_socials',[]),
-        'tech': [t.strip() for t in st.session_state.get('form_tech','').split(',') if t.strip()],
-        'education': st.session_state.get('form_education',''),
-        'cpi': st.session_state.get('form_cpi',''),
-        'certifications': [c.strip() for c in st.session_state.get('form_certs','').splitlines() if c.strip()],
-        'projects': st.session_state.get('projects',[]),
-        'github': st.session_state.get('form_github',''),
-        'phone': st.session_state.get('form_phone',''),
-        'email': st.session_state.get('form_email',''),
-        'linkedin': st.session_state.get('form_linkedin','')
-    }
-    save_presets(presets)
-    st.success(f'Saved preset {key}')
+    try:
+        profile = Profile.from_state(st.session_state)
+        saved = st.session_state.get('saved_preset')
+        if saved and saved[0] == profile.digest and saved[1] in get_preset_store():
+            st.info(f'No changes since it was saved as {saved[1]}')
+        else:
+            key = f'preset-{uuid.uuid4().hex[:6]}'
+            save_preset(key, profile)
+            st.success(f'Saved preset {key}')
+    except ProfileError as e:
+        st.error(f'Not saved — {e}')
 
 # Assemble final data
-data = {
-    'name': st.session_state.get('form_name','Your Name'),
-    'title': st.session_state.get('form_title',''),
-    'about': st.session_state.get('form_about',''),
-    'socials': st.session_state.get('form_socials',[]),
-    'tech': [t.strip() for t in st.session_state.get('form_tech','').split(',') if t.strip()],
-    'education': st.session_state.get('form_education',''),
-    'cpi': st.session_state.get('form_cpi',''),
-    'certifications': [c.strip() for c in st.session_state.get('form_certs','').splitlines() if c.strip()],
-    'projects': st.session_state.get('projects',[]),
-    'objective': 'I am looking for internships or entry-level roles to build and learn.',
-    'phone': st.session_state.get('form_phone',''),
-    'email': st.session_state.get('form_email',''),
-    'linkedin': st.session_state.get('form_linkedin',''),
-    'github': st.session_state.get('form_github','')
-}
+try:
+    data = Profile.from_state(
+        st.session_state, objective='I am looking for internships or entry-level roles to build and learn.').to_dict()
+except ProfileError as e:
+    st.error(f'Cannot build the README — {e}')
+    st.stop()
 
 # Lottie header (small, only if available)
 if st_lottie:
-    lottie_header = load_lottie_url('https://assets7.lottiefiles.com/packages/lf20_jcikwtux.json')
+    with run.stage('lottie_header'):
+        lottie_header = lottie_loader.get_named('header')
     if lottie_header:
         try:
             st_lottie(lottie_header, height=140, key='lottie_header_main')
@@ -468,29 +408,61 @@ if st_lottie:
             pass
 
 # QR generation and preview
-qr_filename = None
+qr_filename = qr_image = None
 if include_qr:
     qr_url = st.text_input('Portfolio / Profile URL (for QR)', value=data.get('github') or '')
     if qr_url:
-        qr_buf = make_qr_png(qr_url)
-        qr_filename = 'portfolio-qr.png'
-        st.image(qr_buf, caption='Generated QR', width=160)
-        download_bytes_button(qr_buf.getvalue(), qr_filename, 'Download QR PNG')
+        with run.stage('qr'):
+            from qr import MIME_TYPES, qr_cache
+            fmt = qr_format.upper()
+            qr_image = qr_cache.get(qr_url, fmt=fmt)
+        qr_filename = qr_file(qr_format)
+        st.image(qr_image.decode('utf-8') if fmt == 'SVG' else qr_image, caption='Generated QR', width=160)
+        with run.stage('download_link'):
+            st.download_button(f'Download QR {fmt}', qr_image, file_name=qr_filename, mime=MIME_TYPES[fmt],
+                               on_click='ignore')
 
 # Generate markdown
-md = generate_markdown(data, template=template, include_qr=bool(qr_filename), qr_filename=qr_filename)
+with run.stage('markdown'):
+    asset_store = None
+    if local_assets:
+        from local_assets import AssetStore
+        asset_store = st.session_state.setdefault('asset_store', AssetStore())
+    md = generate_markdown(data, template=template, include_qr=bool(qr_filename), qr_filename=qr_filename,
+                           assets=asset_store)
 
 st.markdown('---')
 st.subheader('Preview / Generated README.md')
-st.code(md, language='markdown')
-
-# Download options
-dlc1, dlc2 = st.columns(2)
-with dlc1:
-    if st.button('Download README.md'):
-        st.download_button('Click to download', md.encode('utf-8'), file_name='README.md', mime='text/markdown')
-with dlc2:
+with run.stage('preview'):
+    st.code(md, language='markdown')
+
+# Download options - served as files (no base64 data URIs in the page); the
+# bundle is only zipped when its button is clicked
+dlc1, dlc2, dlc3 = st.columns(3)
+dlc1.download_button('Download README.md', md.encode('utf-8'), file_name='README.md', mime='text/markdown',
+                     on_click='ignore')
+dlc2.download_button('Download bundle (.zip)',
+                     partial(build_bundle, data, template, qr_image, qr_filename or QR_FILENAME, asset_store),
+                     file_name='readme-bundle.zip', mime='application/zip', on_click='ignore',
+                     help='README.md with its QR image and local assets, ready to commit')
+with dlc3:
     if st.button('Copy to clipboard (open preview, select & copy)'):
         st.info('Use the download button or copy directly from the preview.')
 
-st.markdown('\\n\\n---\\nBuilt with ❤️ — README Maker Final (Clean)')
\ No newline at end of file
+st.markdown('\\n\\n---\\nBuilt with ❤️ — README Maker Final (Clean)')
+
+# Timing panel (optional)
+run.finish()
+with st.sidebar:
+    st.markdown('---')
+    if st.checkbox('Show timing panel', key='show_timing'):
+        stats = profiler.stats()
+        st.caption('Per-stage milliseconds over the last reruns (all sessions)')
+        st.table([
+            dict(stage=name, **{k: (round(v * 1000, 2) if k != 'count' else v) for k, v in row.items()})
+            for name, row in sorted(stats.items())
+        ])
+        st.caption('Last rerun: ' + ', '.join(f'{k} {v * 1000:.1f}ms' for k, v in run.stages.items()))
+        tc1, tc2 = st.columns(2)
+        tc1.download_button('JSON lines', profiler.to_jsonl(), file_name='timings.jsonl', mime='application/x-ndjson')
+        tc2.download_button('Prometheus', profiler.to_prometheus(), file_name='timings.prom', mime='text/plain')
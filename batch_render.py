@@ -0,0 +1,164 @@
+# Headless batch renderer.
+#
+#   python batch_render.py profiles.jsonl --out build/ --workers 8
+#   python batch_render.py presets.json --template resume-style --qr
+#   python batch_render.py presets.json --qr --qr-format svg
+#
+# Input is either JSONL (one profile dict per line, same shape as the app's
+# `data` dict) or a presets.json file. Profiles are streamed to a process
+# pool with a bounded number of jobs in flight, and each README is written
+# as soon as it is rendered, so memory stays flat for any batch size.
+# --local-assets draws badges and stats cards into one shared <out>/assets
+# directory instead of linking shields.io / github-readme-stats.
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from caching import atomic_open, atomic_write
+from renderer import QR_FILENAME, QR_FORMATS, TEMPLATES, qr_file, write_markdown
+
+ASSETS_DIR = 'assets'
+
+# -------------------- Input --------------------
+def iter_jsonl(path, on_error=None):
+    # lines that aren't a JSON object are passed to on_error(lineno, message)
+    # (default: printed to stderr) and skipped, so one bad line doesn't stop
+    # the batch
+    on_error = on_error or (lambda lineno, message: print(f'{path}:{lineno}: {message}', file=sys.stderr))
+    with open(path, 'r', encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                profile = json.loads(line)
+            except ValueError as e:
+                on_error(lineno, f'invalid JSON: {e}')
+                continue
+            if not isinstance(profile, dict):
+                on_error(lineno, f'expected an object, got {type(profile).__name__}')
+                continue
+            github = profile.get('github')
+            key = (profile.get('id') or (github_login(github) if isinstance(github, str) else '')
+                   or profile.get('name') or f'profile-{lineno}')
+            yield str(key), profile
+
+def iter_presets(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        presets = json.load(f)
+    for key, profile in presets.items():
+        yield key, profile
+
+def iter_profiles(path, on_error=None):
+    if path.endswith('.jsonl'):
+        return iter_jsonl(path, on_error)
+    return iter_presets(path)
+
+def github_login(github):
+    return (github or '').strip().rstrip('/').split('/')[-1]
+
+def slugify(key):
+    return re.sub(r'[^A-Za-z0-9._-]+', '-', key).strip('-.') or 'profile'
+
+# -------------------- Worker --------------------
+_asset_stores = {}
+
+def asset_store(out_dir):
+    # one store per output directory and process, so its memo (and the
+    # renderer's section caches keyed by it) survive across jobs
+    store = _asset_stores.get(out_dir)
+    if store is None:
+        from local_assets import AssetStore
+        store = _asset_stores[out_dir] = AssetStore(os.path.join(out_dir, ASSETS_DIR), f'../{ASSETS_DIR}')
+    return store
+
+def render_one(job):
+    slug, profile, template, out_dir, with_qr, qr_format, local_assets = job
+    target = os.path.join(out_dir, slug)
+    os.makedirs(target, exist_ok=True)
+    qr_filename = None
+    qr_url = profile.get('qr_url') or profile.get('github') or ''
+    if with_qr and qr_url:
+        from qr import qr_cache
+        qr_filename = qr_file(qr_format)
+        atomic_write(os.path.join(target, qr_filename), qr_cache.get(qr_url, fmt=qr_format.upper()))
+    # a render that fails partway leaves the previous README in place
+    with atomic_open(os.path.join(target, 'README.md')) as f:
+        write_markdown(f, profile, template=template, include_qr=bool(qr_filename), qr_filename=qr_filename,
+                       assets=asset_store(out_dir) if local_assets else None)
+    return slug
+
+# -------------------- Driver --------------------
+def unique_slugs(profiles):
+    seen = set()
+    for key, profile in profiles:
+        slug = base = slugify(key)
+        n = 1
+        while slug in seen:
+            n += 1
+            slug = f'{base}-{n}'
+        seen.add(slug)
+        yield slug, profile
+
+def run_batch(path, out_dir, template='clean-minimal', workers=None, with_qr=False, max_in_flight=None, log=sys.stderr,
+              local_assets=False, qr_format='png'):
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    os.makedirs(out_dir, exist_ok=True)
+    done = failed = 0
+    start = time.perf_counter()
+    pending = {}  # future -> slug, so a failure says which profile it was
+
+    def drain():
+        nonlocal done, failed
+        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for fut in finished:
+            slug = pending.pop(fut)
+            try:
+                fut.result()
+                done += 1
+            except Exception as e:
+                failed += 1
+                print(f'{slug}: render failed: {e}', file=log)
+
+    def bad_line(lineno, message):
+        nonlocal failed
+        failed += 1
+        print(f'{path}:{lineno}: {message}', file=log)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for slug, profile in unique_slugs(iter_profiles(path, bad_line)):
+            if len(pending) >= max_in_flight:
+                drain()
+            job = (slug, profile, template, out_dir, with_qr, qr_format, local_assets)
+            pending[pool.submit(render_one, job)] = slug
+        while pending:
+            drain()
+
+    elapsed = time.perf_counter() - start
+    rate = done / elapsed if elapsed > 0 else 0.0
+    print(f'rendered {done} profiles ({failed} failed) in {elapsed:.2f}s — {rate:.1f} profiles/sec', file=log)
+    return {'rendered': done, 'failed': failed, 'seconds': elapsed, 'profiles_per_sec': rate}
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Render README.md files for many profiles.')
+    ap.add_argument('input', help='profiles .jsonl file or presets.json')
+    ap.add_argument('--out', default='build', help='output directory (one sub-directory per profile)')
+    ap.add_argument('--template', default='clean-minimal', choices=TEMPLATES)
+    ap.add_argument('--workers', type=int, default=None, help='process pool size (default: CPU count)')
+    ap.add_argument('--max-in-flight', type=int, default=None, help='queued jobs cap (default: 4 x workers)')
+    ap.add_argument('--qr', action='store_true', help=f'also write {QR_FILENAME} from qr_url / github')
+    ap.add_argument('--qr-format', default='png', choices=QR_FORMATS, help='QR image format (svg scales and is smaller)')
+    ap.add_argument('--local-assets', action='store_true', help=f'render badges/stats cards as SVGs in <out>/{ASSETS_DIR}')
+    args = ap.parse_args(argv)
+    stats = run_batch(args.input, args.out, template=args.template, workers=args.workers,
+                      with_qr=args.qr, qr_format=args.qr_format, max_in_flight=args.max_in_flight,
+                      local_assets=args.local_assets)
+    return 1 if stats['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
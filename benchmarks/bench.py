@@ -0,0 +1,206 @@
+# Offline benchmark suite.
+#
+#   python benchmarks/bench.py --update-baseline  # record this machine's baseline
+#   python benchmarks/bench.py                    # run and compare with it
+#   python benchmarks/bench.py -k qr              # only cases whose name contains "qr"
+#
+# Every case reports the best per-call time over a few repeats and the peak
+# traced memory of one call. The run fails (exit 1) when a case is slower or
+# allocates more than the baseline by more than --tolerance.
+#
+# The recorded baseline is baseline.local.json, which is not committed:
+# timings only mean something on the machine that recorded them. The
+# committed baseline.json holds example numbers from one developer
+# machine; until a local baseline exists the run is compared with those
+# for reference only and never fails.
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import renderer  # noqa: E402
+from synthetic import SIZES, make_presets, make_profile, make_url  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.local.json')
+EXAMPLE_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+def measure(fn, setup=None, repeat=5, min_time=0.05):
+    # best per-call seconds, and peak bytes allocated by a single call
+    best = float('inf')
+    for _ in range(repeat):
+        calls, elapsed = 0, 0.0
+        while elapsed < min_time or calls == 0:
+            if setup:
+                setup()
+            t0 = time.perf_counter()
+            fn()
+            elapsed += time.perf_counter() - t0
+            calls += 1
+        best = min(best, elapsed / calls)
+    if setup:
+        setup()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+# -------------------- Cases --------------------
+def render_cases():
+    for size in SIZES:
+        profile = make_profile(size)
+        for template in renderer.TEMPLATES:
+            yield f'render/{template}/{size}/cold', (
+                lambda p=profile, t=template: renderer.generate_markdown(p, t, include_qr=True, qr_filename='qr.png'),
+                renderer.clear_caches)
+            state = {'n': 0}
+
+            def edit(p=profile, t=template, state=state):
+                state['n'] += 1
+                p['about'] = f"edit {state['n']}"
+                renderer.generate_markdown(p, t, include_qr=True, qr_filename='qr.png')
+            yield f'render/{template}/{size}/edit-about', (edit, None)
+
+def badge_cases():
+    for n in (100, 5000):
+        names = [f'Tech{i}' for i in range(n)]
+        yield f'badge_md/{n}', (lambda names=names: [renderer.badge_md(x) for x in names], renderer.badge_md.cache_clear)
+
+def qr_cases():
+    try:
+        import qr
+    except ImportError:
+        return
+    for length in (20, 200, 1000):
+        url = make_url(length)
+        for box_size in (4, 10):
+            yield f'qr/render/url{length}/box{box_size}', (lambda u=url, b=box_size: qr.render_qr(u, box_size=b), None)
+        yield f'qr/render-svg/url{length}', (lambda u=url: qr.render_qr(u, fmt='SVG'), None)
+        yield f'qr/render-pil/url{length}/box10', (lambda u=url: qr.render_qr_pil(u), None)
+        yield f'qr/make_qr_png/url{length}/cached', (lambda u=url: qr.make_qr_png(u), None)
+
+def profile_cases():
+    from profile_model import Profile
+    for size in SIZES:
+        data = make_profile(size)
+        profile = Profile.from_dict(data)
+        yield f'profile/from_dict/{size}', (lambda d=data: Profile.from_dict(d), None)
+        yield f'profile/to_dict/{size}', (profile.to_dict, None)
+        yield f'profile/digest/{size}', (lambda d=data: Profile.from_dict(d).digest, None)
+
+def preset_cases(tmpdir):
+    import preset_store
+    for n in (10, 1000, 10000):
+        presets = make_presets(n)
+        path = os.path.join(tmpdir, f'presets-{n}.json')
+        preset_store.save_presets(presets, path)
+        yield f'presets/load_presets/{n}', (lambda path=path: preset_store.load_presets(path), None)
+        yield f'presets/save_presets/{n}', (lambda presets=presets, path=path: preset_store.save_presets(presets, path), None)
+        store = preset_store.PresetStore(os.path.join(tmpdir, f'presets-{n}.db'), migrate_from=path)
+        name = next(iter(presets))
+        yield f'presets/store.names/{n}', (store.names, None)
+        yield f'presets/store.get/{n}', (lambda store=store, name=name: store.get(name), None)
+        yield f'presets/store.put/{n}', (lambda store=store, name=name, p=presets[name]: store.put(name, p), None)
+        # bulk JSONL import/export, in-process so peak memory is traced;
+        # peak should stay flat as n grows
+        import preset_io
+        jsonl = os.path.join(tmpdir, f'presets-{n}.jsonl')
+        with open(jsonl, 'wb') as f:
+            preset_io.export_jsonl(store, f)
+
+        def bulk_import(jsonl=jsonl, store=store):
+            with open(jsonl, 'rb') as f:
+                preset_io.import_jsonl(f, store, workers=0)
+        yield f'presets/import_jsonl/{n}', (bulk_import, None)
+
+        def bulk_export(store=store, n=n):
+            with open(os.path.join(tmpdir, f'export-{n}.jsonl'), 'wb') as f:
+                preset_io.export_jsonl(store, f)
+        yield f'presets/export_jsonl/{n}', (bulk_export, None)
+
+def all_cases(tmpdir):
+    yield from render_cases()
+    yield from badge_cases()
+    yield from qr_cases()
+    yield from profile_cases()
+    yield from preset_cases(tmpdir)
+
+# -------------------- Driver --------------------
+def compare(results, baseline, tolerance, min_delta=0.0001):
+    # min_delta (seconds) keeps scheduler jitter on microsecond cases from
+    # counting as a regression
+    failures = []
+    for name, row in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if row['seconds'] > base['seconds'] * (1 + tolerance) + min_delta:
+            failures.append(f"{name}: {row['seconds'] * 1000:.3f}ms vs baseline {base['seconds'] * 1000:.3f}ms")
+        if row['peak_bytes'] > base['peak_bytes'] * (1 + tolerance) + 4096:
+            failures.append(f"{name}: peak {row['peak_bytes']}B vs baseline {base['peak_bytes']}B")
+    return failures
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark rendering, QR and preset I/O.')
+    ap.add_argument('-k', dest='pattern', default='', help='only run cases whose name contains this')
+    ap.add_argument('--baseline', default=BASELINE,
+                    help='baseline to compare with / record (default: benchmarks/baseline.local.json; the committed '
+                         'benchmarks/baseline.json only holds example numbers from another machine)')
+    ap.add_argument('--update-baseline', action='store_true', help="record this machine's baseline")
+    ap.add_argument('--tolerance', type=float, default=0.5, help='allowed slowdown / memory growth (0.5 = +50%%)')
+    ap.add_argument('--min-delta-ms', type=float, default=0.1, help='ignore slowdowns smaller than this')
+    ap.add_argument('--repeat', type=int, default=5)
+    ap.add_argument('--json', help='also write results to this file')
+    args = ap.parse_args(argv)
+
+    tmpdir = tempfile.mkdtemp(prefix='readme-bench-')
+    results = {}
+    try:
+        print(f"{'case':55} {'ms/call':>10} {'peak KiB':>10}")
+        for name, (fn, setup) in all_cases(tmpdir):
+            if args.pattern not in name:
+                continue
+            seconds, peak = measure(fn, setup, repeat=args.repeat)
+            results[name] = {'seconds': seconds, 'peak_bytes': peak}
+            print(f'{name:55} {seconds * 1000:10.3f} {peak / 1024:10.1f}')
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f'baseline written to {args.baseline}')
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f'no baseline recorded on this machine yet - run with --update-baseline to create {args.baseline}')
+        if args.baseline == BASELINE and os.path.exists(EXAMPLE_BASELINE):
+            with open(EXAMPLE_BASELINE, 'r', encoding='utf-8') as f:
+                example = json.load(f)
+            for failure in compare(results, example, args.tolerance, args.min_delta_ms / 1000):
+                print(f'slower than the example numbers (informational) {failure}')
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    failures = compare(results, baseline, args.tolerance, args.min_delta_ms / 1000)
+    for failure in failures:
+        print(f'REGRESSION {failure}')
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
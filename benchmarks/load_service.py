@@ -0,0 +1,110 @@
+# Load test for render_service.py.
+#
+#   python benchmarks/load_service.py --spawn --concurrency 64 --requests 5000
+#   python benchmarks/load_service.py --url http://127.0.0.1:8700 --endpoint qr
+#
+# Opens --concurrency keep-alive connections, sends --requests requests
+# across them and reports throughput and p50/p90/p99 latency. --spawn
+# starts a service in this process on a free port first.
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from profiler import percentile  # noqa: E402
+from synthetic import make_profile, make_url  # noqa: E402
+
+def build_body(endpoint, size, template):
+    if endpoint == 'qr':
+        return json.dumps({'url': make_url(80), 'box_size': 6}).encode()
+    return json.dumps({'data': make_profile(size), 'template': template}).encode()
+
+async def worker(host, port, path, body, n, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    request = (f'POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n'
+               f'Content-Length: {len(body)}\r\n\r\n').encode() + body
+    try:
+        for _ in range(n):
+            t0 = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+            if length:
+                await reader.readexactly(length)
+            latencies.append(time.perf_counter() - t0)
+            status = int(status_line.split()[1])
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+async def load(host, port, endpoint, concurrency, requests, size, template):
+    body = build_body(endpoint, size, template)
+    latencies, statuses = [], {}
+    per_conn = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, f'/{endpoint}', body, n, latencies, statuses) for n in per_conn if n))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.5) * 1000,
+        'p90_ms': percentile(latencies, 0.9) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'statuses': statuses,
+    }
+
+async def run(args):
+    service = server = None
+    if args.spawn:
+        from render_service import RenderService
+        service = RenderService(workers=args.workers, max_pending=args.max_pending)
+        server = await service.start('127.0.0.1', 0)
+        host, port = server.sockets[0].getsockname()[:2]
+    else:
+        u = urlparse(args.url)
+        host, port = u.hostname, u.port or 80
+    try:
+        return await load(host, port, args.endpoint, args.concurrency, args.requests, args.size, args.template)
+    finally:
+        if server is not None:
+            await asyncio.sleep(0.05)  # let handlers see the clients hang up
+            server.close()
+            await service.close()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Load-test the README render service.')
+    ap.add_argument('--url', default='http://127.0.0.1:8700')
+    ap.add_argument('--spawn', action='store_true', help='start a service in-process on a free port')
+    ap.add_argument('--workers', type=int, default=None, help='service workers when --spawn is used')
+    ap.add_argument('--max-pending', type=int, default=1024, help='service queue limit when --spawn is used')
+    ap.add_argument('--endpoint', choices=['render', 'qr'], default='render')
+    ap.add_argument('--size', default='small', help='synthetic profile size for /render')
+    ap.add_argument('--template', default='fancy-animated')
+    ap.add_argument('--concurrency', type=int, default=32)
+    ap.add_argument('--requests', type=int, default=2000)
+    args = ap.parse_args(argv)
+    stats = asyncio.run(run(args))
+    print(f"{stats['requests']} requests in {stats['seconds']:.2f}s at concurrency {args.concurrency}: "
+          f"{stats['rps']:.0f} req/s, p50 {stats['p50_ms']:.2f}ms, p90 {stats['p90_ms']:.2f}ms, "
+          f"p99 {stats['p99_ms']:.2f}ms, statuses {stats['statuses']}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
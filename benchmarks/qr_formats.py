@@ -0,0 +1,79 @@
+# QR output comparison: ms and bytes per QR for each output path.
+#
+#   python benchmarks/qr_formats.py
+#   python benchmarks/qr_formats.py --lengths 20 200 1000 2000 --box-size 4
+#
+#   pil    qrcode's PIL image factory (RGB PNG, the old make_qr_png path)
+#   png    1-bit palette PNG drawn from the module matrix
+#   svg    one <path> of horizontal runs
+# png and svg run with and without NumPy. The png output is checked pixel
+# for pixel against pil, so only size and speed may differ. `zipped` is
+# what the file costs inside the README bundle (SVG is deflated there).
+import argparse
+import os
+import sys
+import time
+import zlib
+from io import BytesIO
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import qr  # noqa: E402
+from synthetic import make_url  # noqa: E402
+
+def per_call(fn, repeat, min_time=0.2):
+    # best seconds per call, and what one call returns
+    best = float('inf')
+    for _ in range(repeat):
+        calls, t0 = 0, time.perf_counter()
+        while calls == 0 or time.perf_counter() - t0 < min_time:
+            data = fn()
+            calls += 1
+        best = min(best, (time.perf_counter() - t0) / calls)
+    return best, data
+
+def zipped(data, fmt):
+    return len(data) if fmt == 'PNG' else len(zlib.compress(data, 6))
+
+def pixels(png):
+    from PIL import Image
+    with Image.open(BytesIO(png)) as img:
+        return img.convert('1').tobytes()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Compare ms and bytes per QR across output formats.')
+    ap.add_argument('--lengths', type=int, nargs='+', default=[20, 200, 1000])
+    ap.add_argument('--box-size', type=int, default=10)
+    ap.add_argument('--repeat', type=int, default=3)
+    args = ap.parse_args(argv)
+
+    numpy = qr._numpy()
+    modes = ((numpy, ''), (None, '/no-numpy')) if numpy is not None else ((None, '/no-numpy'),)
+    failures = 0
+    print(f"{'case':24} {'ms/QR':>9} {'bytes':>8} {'zipped':>8} {'speed':>7} {'size':>7}")
+    for length in args.lengths:
+        url = make_url(length)
+        reference = qr.render_qr_pil(url, box_size=args.box_size)
+        base_s, _ = per_call(lambda: qr.render_qr_pil(url, box_size=args.box_size), args.repeat)
+        base_bytes = len(reference)
+        print(f"{f'url{length}/pil':24} {base_s * 1000:9.2f} {base_bytes:8} {base_bytes:8}")
+        for fmt in ('PNG', 'SVG'):
+            for module, suffix in modes:
+                qr._numpy = lambda module=module: module
+                try:
+                    render = lambda: qr.render_qr(url, box_size=args.box_size, fmt=fmt)  # noqa: E731
+                    seconds, data = per_call(render, args.repeat)
+                    if fmt == 'PNG' and pixels(data) != pixels(reference):
+                        failures += 1
+                        print(f'MISMATCH url{length}/png{suffix}')
+                finally:
+                    qr._numpy = lambda: numpy
+                packed = zipped(data, fmt)
+                print(f"{f'url{length}/{fmt.lower()}{suffix}':24} {seconds * 1000:9.2f} {len(data):8} {packed:8} "
+                      f'{base_s / seconds:6.1f}x {packed / base_bytes:6.0%}')
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
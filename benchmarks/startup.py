@@ -0,0 +1,115 @@
+# Cold-start benchmark.
+#
+#   python benchmarks/startup.py --update-baseline  # record this machine's baseline
+#   python benchmarks/startup.py                    # run and compare with it
+#
+# Every measurement runs in a fresh interpreter, like a new replica would:
+#   import/<module>   cumulative import time from `python -X importtime`
+#   app/first-render  first full run of app.py (AppTest, no browser)
+# It also fails when a module that should load lazily (QR, requests, ...)
+# is already imported after the first render.
+#
+# As in bench.py, timings are compared with startup_baseline.local.json
+# (recorded here, not committed). The committed startup_baseline.json holds
+# example numbers from one developer machine and is only shown for
+# reference until a local baseline exists.
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_baseline.local.json')
+EXAMPLE_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_baseline.json')
+
+MODULES = ('renderer', 'caching', 'preset_store', 'profiler', 'lottie_assets', 'qr', 'local_assets',
+           'bundle', 'github_import', 'link_checker', 'profile_model', 'preset_io')
+# must not be imported until their feature is used
+LAZY = ('qrcode', 'qr', 'requests', 'link_checker', 'local_assets', 'bundle', 'streamlit_lottie', 'preset_io')
+
+FIRST_RENDER = '''
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=60).run()
+t2 = time.perf_counter()
+print(json.dumps({'streamlit_import': t1 - t0, 'first_render': t2 - t1,
+                  'errors': [str(e.value) for e in at.exception],
+                  'loaded': [m for m in sys.argv[2:] if m in sys.modules]}))
+'''
+
+def import_time(module):
+    # seconds; the last -X importtime line is the requested module's total
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    last = proc.stderr.strip().splitlines()[-1]
+    return int(last.split('|')[1]) / 1e6
+
+def first_render():
+    proc = subprocess.run([sys.executable, '-c', FIRST_RENDER, os.path.join(ROOT, 'app.py'), *LAZY],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def best_of(fn, repeat):
+    return min(fn() for _ in range(repeat))
+
+def compare(results, baseline, tolerance, min_delta):
+    slower = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base is not None and seconds > base * (1 + tolerance) + min_delta:
+            slower.append(f'{name}: {seconds * 1000:.1f}ms vs baseline {base * 1000:.1f}ms')
+    return slower
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Measure import time and time-to-first-render in fresh interpreters.')
+    ap.add_argument('--baseline', default=BASELINE,
+                    help='baseline to compare with / record (default: benchmarks/startup_baseline.local.json; the '
+                         'committed benchmarks/startup_baseline.json only holds example numbers from another machine)')
+    ap.add_argument('--update-baseline', action='store_true', help="record this machine's baseline")
+    ap.add_argument('--tolerance', type=float, default=0.5, help='allowed slowdown (0.5 = +50%%)')
+    ap.add_argument('--min-delta-ms', type=float, default=20.0, help='ignore slowdowns smaller than this')
+    ap.add_argument('--repeat', type=int, default=3)
+    ap.add_argument('--json', help='also write results to this file')
+    args = ap.parse_args(argv)
+
+    results = {}
+    print(f"{'case':35} {'ms':>10}")
+    for module in MODULES:
+        results[f'import/{module}'] = best_of(lambda: import_time(module), args.repeat)
+        print(f"{'import/' + module:35} {results[f'import/{module}'] * 1000:10.1f}")
+    runs = [first_render() for _ in range(args.repeat)]
+    results['app/streamlit-import'] = min(r['streamlit_import'] for r in runs)
+    results['app/first-render'] = min(r['first_render'] for r in runs)
+    for name in ('app/streamlit-import', 'app/first-render'):
+        print(f'{name:35} {results[name] * 1000:10.1f}')
+
+    failures = [f'app raised: {e}' for e in runs[0]['errors']]
+    failures += [f'{m} imported before its feature was used' for m in runs[0]['loaded']]
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f'baseline written to {args.baseline}')
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        failures += compare(results, baseline, args.tolerance, args.min_delta_ms / 1000)
+    else:
+        print(f'no baseline recorded on this machine yet - run with --update-baseline to create {args.baseline}')
+        if args.baseline == BASELINE and os.path.exists(EXAMPLE_BASELINE):
+            with open(EXAMPLE_BASELINE, 'r', encoding='utf-8') as f:
+                example = json.load(f)
+            for slower in compare(results, example, args.tolerance, args.min_delta_ms / 1000):
+                print(f'slower than the example numbers (informational) {slower}')
+    for failure in failures:
+        print(f'REGRESSION {failure}')
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
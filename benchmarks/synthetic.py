@@ -0,0 +1,54 @@
+# Deterministic synthetic profiles for the benchmarks.
+import random
+
+SIZES = {
+    # name: (projects, links per project, tech badges, socials, certifications)
+    'tiny': (1, 1, 3, 2, 1),
+    'small': (10, 2, 20, 4, 3),
+    'medium': (100, 3, 200, 10, 10),
+    'large': (1000, 5, 5000, 200, 50),
+}
+
+WORDS = ('fast', 'tiny', 'cloud', 'graph', 'neural', 'stream', 'secure', 'pixel', 'quantum', 'rust',
+         'python', 'vision', 'parser', 'engine', 'api', 'cache', 'search', 'index', 'data', 'web')
+
+def _words(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+def make_profile(size='small', seed=0):
+    n_projects, n_links, n_tech, n_socials, n_certs = SIZES[size]
+    rng = random.Random(f'{size}-{seed}')
+    return {
+        'name': f'Synthetic User {seed}',
+        'title': _words(rng, 4).title(),
+        'about': _words(rng, 60),
+        'socials': [
+            {'label': rng.choice(['LinkedIn', 'Instagram', 'Email', 'Blog', 'Mastodon']), 'url': f'https://example.com/{size}/{seed}/s{i}'}
+            for i in range(n_socials)
+        ],
+        'tech': [f'{rng.choice(WORDS).title()}{i}' for i in range(n_tech)],
+        'education': 'B.Tech, Computer Science',
+        'cpi': '8.7',
+        'certifications': [f'Certificate in {_words(rng, 3)}' for _ in range(n_certs)],
+        'projects': [
+            {
+                'name': f'{_words(rng, 2).title()} {i}',
+                'links': [f'https://github.com/synthetic/{size}-{seed}-{i}-{j}' for j in range(n_links)],
+                'tags': ', '.join(rng.sample(WORDS, 3)),
+                'desc': _words(rng, 40),
+            }
+            for i in range(n_projects)
+        ],
+        'objective': 'I am looking for internships or entry-level roles to build and learn.',
+        'phone': '+1 555 0100',
+        'email': f'user{seed}@example.com',
+        'linkedin': f'https://linkedin.com/in/synthetic{seed}',
+        'github': f'https://github.com/synthetic{seed}',
+    }
+
+def make_presets(n, size='tiny'):
+    return {f'preset-{i:06d}': make_profile(size, seed=i) for i in range(n)}
+
+def make_url(length):
+    base = 'https://example.com/portfolio/'
+    return (base + 'x' * max(0, length - len(base)))[:length]
@@ -0,0 +1,37 @@
+# README bundle export: one ZIP with README.md, the QR image it references
+# and any local SVG assets, ready to commit as-is.
+#
+# The archive is written straight to a file-like sink (a file, an HTTP
+# response, BytesIO) and README.md is streamed into it section by section,
+# so the document never exists as one string. Nothing is built until the
+# caller asks for the bundle.
+import re
+import zipfile
+from io import BytesIO
+
+from renderer import QR_FILENAME, iter_markdown
+
+def write_bundle(sink, data, template='clean-minimal', qr_image=None, qr_filename=QR_FILENAME, assets=None,
+                 readme_name='README.md'):
+    # qr_image: PNG/SVG bytes, or None to leave the QR section (and file) out.
+    # assets: the AssetStore the README was rendered with; only files the
+    # README actually links to are added, under their link path.
+    qr_filename = qr_filename if qr_image else None
+    link = re.compile(re.escape(assets.prefix) + r'/([\w.-]+\.svg)') if assets is not None else None
+    used = {}
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with zf.open(readme_name, 'w') as f:
+            for piece in iter_markdown(data, template, bool(qr_filename), qr_filename, assets):
+                f.write(piece.encode('utf-8'))
+                if link is not None:
+                    used.update(dict.fromkeys(link.findall(piece)))
+        if qr_filename:
+            # PNG is already deflated, SVG is text
+            stored = qr_filename.lower().endswith('.png')
+            zf.writestr(qr_filename, qr_image, compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+        for name in used:
+            zf.writestr(f'{assets.prefix}/{name}', assets.read(name))
+    return sink
+
+def bundle_bytes(data, template='clean-minimal', qr_image=None, qr_filename=QR_FILENAME, assets=None):
+    return write_bundle(BytesIO(), data, template, qr_image, qr_filename, assets).getvalue()
@@ -0,0 +1,113 @@
+# Small cache building blocks shared by the renderer, QR and asset code:
+# a thread-safe in-memory LRU and a content-addressed on-disk store that
+# several processes can share.
+import hashlib
+import os
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+
+# README_MAKER_CACHE_DIR enables the shared disk tiers for the app
+CACHE_DIR = os.environ.get('README_MAKER_CACHE_DIR', '')
+
+class LRU:
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return self._data[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+def digest(key):
+    return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+
+class DiskCache:
+    # Files live at <root>/<ab>/<digest><suffix>. Writes go to a temp file
+    # in the same directory and are os.replace()d into place, so concurrent
+    # readers never see a partial entry. ttl (seconds) is checked against
+    # the file mtime; None means entries never expire.
+    def __init__(self, root, suffix='', ttl=None):
+        self.root = root
+        self.suffix = suffix
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        d = digest(key)
+        return os.path.join(self.root, d[:2], d + self.suffix)
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            if self.ttl is not None and time.time() - os.path.getmtime(path) > self.ttl:
+                self.misses += 1
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        path = self.path(key)
+        try:
+            atomic_write(path, data)
+        except OSError:
+            # a read-only or full disk only costs us the cache
+            return None
+        return path
+
+def atomic_write(path, data):
+    with atomic_open(path) as f:
+        f.write(data)
+
+@contextmanager
+def atomic_open(path):
+    # binary file for streaming into path: a temp file in the target
+    # directory + os.replace() on success, so readers only ever see the
+    # previous or a complete file, never a partly written one. The temp
+    # file is opened normally (not mkstemp's 0600) so the result gets the
+    # usual umask permissions.
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    tmp = os.path.join(directory, f'.{os.path.basename(path)}.{uuid.uuid4().hex[:12]}.tmp')
+    try:
+        with open(tmp, 'xb') as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,200 @@
+# GitHub profile importer.
+#
+# One pooled requests.Session is shared by a small thread pool: the user
+# and the first repos page are fetched together, the remaining pages (found
+# via the Link header) in parallel, then every repo's /languages endpoint.
+# Language bytes are summed into a ranked `tech` list and projects are
+# picked by a configurable ranking. Rate-limited responses are retried
+# after the X-RateLimit-Reset / Retry-After time (bounded by max_wait).
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+API_URL = 'https://api.github.com'
+PER_PAGE = 100
+
+RANKINGS = {
+    'pushed': lambda r: r.get('pushed_at') or '',
+    'stars': lambda r: (r.get('stargazers_count') or 0, r.get('pushed_at') or ''),
+    'forks': lambda r: (r.get('forks_count') or 0, r.get('pushed_at') or ''),
+    'size': lambda r: (r.get('size') or 0, r.get('pushed_at') or ''),
+}
+
+class GitHubImportError(Exception):
+    pass
+
+def make_session(token=None, pool_size=16):
+    # requests is imported here rather than at the top so the app can show
+    # the import form (RANKINGS etc.) without paying for it at startup
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept'] = 'application/vnd.github.v3+json'
+    if token:
+        session.headers['Authorization'] = f'token {token}'
+    return session
+
+def rate_limit_delay(response, now=None):
+    # seconds to wait before retrying, or None if this isn't a rate limit
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get('Retry-After')
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        reset = response.headers.get('X-RateLimit-Reset', '')
+        if reset.isdigit():
+            return max(0.0, int(reset) - (now or time.time())) + 1
+        return 60.0
+    return None
+
+def user_path(username, rest=''):
+    # usernames come from forms and job files, so they're percent-encoded
+    # rather than trusted to be a single path segment
+    return f"/users/{quote(username, safe='')}{rest}"
+
+def last_page(response):
+    m = re.search(r'[?&]page=(\d+)[^>]*>;\s*rel="last"', response.headers.get('Link', ''))
+    return int(m.group(1)) if m else None
+
+class GitHubImporter:
+    def __init__(self, token=None, api_url=API_URL, workers=8, timeout=10, max_wait=60, session=None):
+        self.api_url = api_url.rstrip('/')
+        self.workers = workers
+        self.timeout = timeout
+        self.max_wait = max_wait
+        self.session = session or make_session(token, pool_size=workers)
+
+    def get(self, path, params=None, headers=None):
+        url = path if path.startswith('http') else f'{self.api_url}{path}'
+        waited = 0.0
+        while True:
+            r = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            delay = rate_limit_delay(r)
+            if delay is None:
+                return r
+            if waited + delay > self.max_wait:
+                raise GitHubImportError('GitHub rate limit exceeded — try again later or use a token.')
+            time.sleep(delay)
+            waited += delay
+
+    def fetch_repos(self, username, pool):
+        # a failed page raises: importing with some repos silently missing
+        # would rank projects and tech from a partial list
+        path = user_path(username, '/repos')
+        params = {'per_page': PER_PAGE, 'sort': 'pushed'}
+        first = self.get(path, params)
+        if first.status_code != 200:
+            raise GitHubImportError(f'Fetching repos of {username} failed (HTTP {first.status_code}).')
+        repos = list(first.json())
+        last = last_page(first)
+        if last and last > 1:
+            pages = pool.map(lambda p: (p, self.get(path, dict(params, page=p))), range(2, last + 1))
+            for p, r in pages:
+                if r.status_code != 200:
+                    raise GitHubImportError(f'Fetching repos page {p} of {username} failed (HTTP {r.status_code}).')
+                repos.extend(r.json())
+        elif len(repos) == PER_PAGE:
+            # no Link header (e.g. a proxy stripped it) - page until short
+            page = 2
+            while True:
+                r = self.get(path, dict(params, page=page))
+                if r.status_code != 200:
+                    raise GitHubImportError(f'Fetching repos page {page} of {username} failed (HTTP {r.status_code}).')
+                batch = r.json()
+                repos.extend(batch)
+                if len(batch) < PER_PAGE:
+                    break
+                page += 1
+        return repos
+
+    def fetch_languages(self, repo):
+        import requests
+        url = repo.get('languages_url') or f"{self.api_url}/repos/{repo.get('full_name')}/languages"
+        try:
+            r = self.get(url)
+        except requests.RequestException:
+            return {}
+        if r.status_code != 200:
+            return {}
+        return r.json() or {}
+
+    def import_profile(self, username, rank_by='pushed', max_projects=8, max_tech=12,
+                       include_forks=True, languages=True):
+        if not username:
+            raise GitHubImportError('Enter a GitHub username to import.')
+        if rank_by not in RANKINGS:
+            raise GitHubImportError(f'Unknown ranking {rank_by!r}; use one of {", ".join(RANKINGS)}.')
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            user_f = pool.submit(self.get, user_path(username))
+            try:
+                repos = self.fetch_repos(username, pool)
+            except GitHubImportError:
+                if user_f.result().status_code == 200:
+                    raise
+                repos = None  # an unknown user fails its repos too; the message below says why
+            u = user_f.result()
+            if u.status_code != 200:
+                raise GitHubImportError('GitHub import failed — check username or rate limits.')
+            user = u.json()
+            if not include_forks:
+                repos = [r for r in repos if not r.get('fork')]
+            repo_languages = None
+            if languages:
+                repo_languages = dict(zip((r.get('full_name') for r in repos), pool.map(self.fetch_languages, repos)))
+        return build_profile(user, repos, repo_languages, rank_by=rank_by, max_projects=max_projects,
+                             max_tech=max_tech, include_forks=include_forks)
+
+def build_profile(user, repos, repo_languages=None, rank_by='pushed', max_projects=8, max_tech=12, include_forks=True):
+    # repo_languages maps full_name -> /languages response; without it each
+    # repo's primary language counts once
+    if not include_forks:
+        repos = [r for r in repos if not r.get('fork')]
+    lang_bytes = {}
+    for repo in repos:
+        if repo_languages is not None:
+            langs = repo_languages.get(repo.get('full_name')) or {}
+        else:
+            langs = {repo['language']: 1} if repo.get('language') else {}
+        for lang, n in langs.items():
+            lang_bytes[lang] = lang_bytes.get(lang, 0) + n
+    ranked = sorted(repos, key=RANKINGS[rank_by], reverse=True)
+    tech = [lang for lang, _ in sorted(lang_bytes.items(), key=lambda kv: (-kv[1], kv[0]))][:max_tech]
+    return {
+        'name': user.get('name') or user.get('login') or '',
+        'title': user.get('bio') or '',
+        'about': user.get('bio') or '',
+        'socials': [],
+        'tech': tech,
+        'education': '',
+        'cpi': '',
+        'certifications': [],
+        'projects': [
+            {
+                'name': repo.get('name'),
+                'links': [repo.get('html_url')],
+                'tags': repo.get('language') or '',
+                'desc': repo.get('description') or '',
+            }
+            for repo in ranked[:max_projects]
+        ],
+        'github': user.get('html_url') or '',
+        # raw numbers for locally drawn stats cards (local_assets.py)
+        'github_stats': {
+            'login': user.get('login') or '',
+            'name': user.get('name') or user.get('login') or '',
+            'public_repos': user.get('public_repos') or len(repos),
+            'followers': user.get('followers') or 0,
+            'stars': sum(r.get('stargazers_count') or 0 for r in repos),
+            'forks': sum(r.get('forks_count') or 0 for r in repos),
+            'languages': {lang: n for lang, n in sorted(lang_bytes.items(), key=lambda kv: (-kv[1], kv[0]))[:max_tech]},
+        },
+    }
+
+def import_profile(username, token=None, **kwargs):
+    importer_kwargs = {k: kwargs.pop(k) for k in ('api_url', 'workers', 'timeout', 'max_wait') if k in kwargs}
+    return GitHubImporter(token=token, **importer_kwargs).import_profile(username, **kwargs)
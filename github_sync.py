@@ -0,0 +1,204 @@
+# Incremental GitHub sync.
+#
+#   python github_sync.py users.txt --store .sync --out build --template fancy-animated
+#
+# users.txt holds one GitHub username per line, or a JSON object per line:
+#   {"username": "octocat", "slug": "octocat-cv", "template": "resume-style", "overrides": {"email": "..."}}
+#
+# Every job's last user/repos/languages responses are kept in a snapshot
+# file together with their ETags. A sync pass sends conditional requests
+# (If-None-Match; a 304 doesn't count against the rate limit), only asks
+# for /languages of repos whose pushed_at moved, and only re-renders a
+# README when the inputs to generate_markdown actually changed.
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from batch_render import ASSETS_DIR, QR_FILENAME, render_one, slugify
+from github_import import API_URL, PER_PAGE, GitHubImporter, GitHubImportError, build_profile, last_page, user_path
+from renderer import QR_FORMATS, TEMPLATES
+
+class SnapshotStore:
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, slug):
+        return os.path.join(self.root, f'{slug}.json')
+
+    def load(self, slug):
+        try:
+            with open(self.path(slug), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, slug, snapshot):
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp, self.path(slug))
+
+def render_key(template, profile, with_qr, local_assets=False, qr_format='png'):
+    blob = json.dumps([template, profile, with_qr and qr_format, local_assets], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+class GitHubSync:
+    def __init__(self, store, token=None, api_url=API_URL, workers=8, importer=None):
+        self.store = store
+        self.importer = importer or GitHubImporter(token=token, api_url=api_url, workers=workers)
+        self.workers = workers
+        self.stats = {'requests': 0, 'not_modified': 0, 'languages_skipped': 0, 'rendered': 0, 'unchanged': 0, 'failed': 0}
+        self._lock = Lock()
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self.stats[name] += n
+
+    def conditional_get(self, path, cached, params=None):
+        # returns (entry, changed, response); entry is {'etag', 'data'}, or
+        # None when the request failed
+        headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else None
+        r = self.importer.get(path, params=params, headers=headers)
+        self._count('requests')
+        if r.status_code == 304 and cached:
+            self._count('not_modified')
+            return cached, False, r
+        if r.status_code == 200:
+            return {'etag': r.headers.get('ETag'), 'data': r.json()}, True, r
+        return None, True, r
+
+    def sync_repos(self, username, snap, pool):
+        path = user_path(username, '/repos')
+        params = {'per_page': PER_PAGE, 'sort': 'pushed'}
+        pages = snap.get('pages', {})
+        # a failed page raises rather than being left out: a partial repo
+        # list would overwrite the snapshot and re-render the README
+        # without those repos
+        first, _, r = self.conditional_get(path, pages.get('1'), params)
+        if first is None:
+            raise GitHubImportError(f'fetching repos of {username} failed (HTTP {r.status_code})')
+        n_pages = last_page(r) or (snap.get('last_page', 1) if r.status_code == 304 else 1)
+        new_pages = {'1': first}
+        rest = list(range(2, n_pages + 1))
+        results = pool.map(lambda p: self.conditional_get(path, pages.get(str(p)), dict(params, page=p)), rest)
+        for p, (entry, _, r) in zip(rest, results):
+            if entry is None:
+                raise GitHubImportError(f'fetching repos page {p} of {username} failed (HTTP {r.status_code})')
+            new_pages[str(p)] = entry
+        return new_pages, n_pages
+
+    def sync_languages(self, repos, snap, pool):
+        old = snap.get('languages', {})
+        languages, todo = {}, []
+        for repo in repos:
+            name = repo.get('full_name')
+            cached = old.get(name)
+            if cached and cached.get('pushed_at') == repo.get('pushed_at'):
+                languages[name] = cached
+                self._count('languages_skipped')
+            else:
+                todo.append(repo)
+
+        def fetch(repo):
+            url = repo.get('languages_url') or f"/repos/{repo.get('full_name')}/languages"
+            entry, _, r = self.conditional_get(url, old.get(repo.get('full_name')))
+            return repo, entry, r
+
+        # like a failed repos page: raise instead of dropping the repo's
+        # languages from the README and the snapshot
+        for repo, entry, r in pool.map(fetch, todo):
+            if entry is None:
+                raise GitHubImportError(f"fetching languages of {repo.get('full_name')} failed (HTTP {r.status_code})")
+            languages[repo.get('full_name')] = dict(entry, pushed_at=repo.get('pushed_at'))
+        return languages
+
+    def sync_user(self, job, out_dir, with_qr=False, pool=None, local_assets=False, qr_format='png', **profile_opts):
+        username = job['username']
+        template = job.get('template', 'clean-minimal')
+        slug = slugify(job.get('slug') or username)
+        snap = self.store.load(slug)
+        user, _, _ = self.conditional_get(user_path(username), snap.get('user'))
+        if user is None:
+            raise GitHubImportError(f'GitHub import failed for {username} — check username or rate limits.')
+        pages, n_pages = self.sync_repos(username, snap, pool)
+        repos = [repo for p in sorted(pages, key=int) for repo in pages[p]['data']]
+        languages = self.sync_languages(repos, snap, pool)
+        profile = build_profile(user['data'], repos, {k: v['data'] for k, v in languages.items()}, **profile_opts)
+        profile.update(job.get('overrides') or {})
+
+        key = render_key(template, profile, with_qr, local_assets, qr_format)
+        readme = os.path.join(out_dir, slug, 'README.md')
+        changed = key != snap.get('render_key') or not os.path.exists(readme)
+        if changed:
+            render_one((slug, profile, template, out_dir, with_qr, qr_format, local_assets))
+            self._count('rendered')
+        else:
+            self._count('unchanged')
+        self.store.save(slug, {
+            'synced_at': time.time(),
+            'user': user,
+            'pages': pages,
+            'last_page': n_pages,
+            'languages': languages,
+            'render_key': key,
+        })
+        return changed
+
+    def run(self, jobs, out_dir, with_qr=False, user_workers=4, log=sys.stderr, local_assets=False, qr_format='png',
+            **profile_opts):
+        os.makedirs(out_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool, \
+                ThreadPoolExecutor(max_workers=user_workers) as users:
+            def one(job):
+                try:
+                    return self.sync_user(job, out_dir, with_qr=with_qr, pool=pool, local_assets=local_assets,
+                                          qr_format=qr_format, **profile_opts)
+                except Exception as e:
+                    self._count('failed')
+                    print(f"sync failed for {job.get('username')}: {e}", file=log)
+            list(users.map(one, jobs))
+        return self.stats
+
+def iter_jobs(path, template):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            job = json.loads(line) if line.startswith('{') else {'username': line}
+            job.setdefault('template', template)
+            yield job
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Keep README.md files in sync with GitHub, re-rendering only what changed.')
+    ap.add_argument('users', help='file with one username (or JSON job) per line')
+    ap.add_argument('--store', default='.sync', help='snapshot directory')
+    ap.add_argument('--out', default='build', help='output directory (one sub-directory per user)')
+    ap.add_argument('--template', default='fancy-animated', choices=TEMPLATES)
+    ap.add_argument('--token', default=os.environ.get('GITHUB_TOKEN'), help='GitHub token (default: $GITHUB_TOKEN)')
+    ap.add_argument('--api-url', default=API_URL)
+    ap.add_argument('--workers', type=int, default=8, help='concurrent API requests')
+    ap.add_argument('--user-workers', type=int, default=4, help='users synced at once')
+    ap.add_argument('--rank-by', default='pushed')
+    ap.add_argument('--max-projects', type=int, default=8)
+    ap.add_argument('--qr', action='store_true', help=f'also write {QR_FILENAME}')
+    ap.add_argument('--qr-format', default='png', choices=QR_FORMATS, help='QR image format')
+    ap.add_argument('--local-assets', action='store_true', help=f'render badges/stats cards as SVGs in <out>/{ASSETS_DIR}')
+    args = ap.parse_args(argv)
+    sync = GitHubSync(SnapshotStore(args.store), token=args.token, api_url=args.api_url, workers=args.workers)
+    start = time.perf_counter()
+    stats = sync.run(list(iter_jobs(args.users, args.template)), args.out, with_qr=args.qr, qr_format=args.qr_format,
+                     local_assets=args.local_assets, user_workers=args.user_workers,
+                     rank_by=args.rank_by, max_projects=args.max_projects)
+    print(f"synced in {time.perf_counter() - start:.2f}s — " + ', '.join(f'{k}={v}' for k, v in stats.items()), file=sys.stderr)
+    return 1 if stats['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
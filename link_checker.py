@@ -0,0 +1,176 @@
+# Dead-link checker for profile data.
+#
+#   python link_checker.py profiles.jsonl --workers 64 --per-host 4
+#   python link_checker.py presets.json --json report.json
+#
+# Every http(s) URL in a profile (project links, socials, github/linkedin)
+# is collected and deduplicated, then checked on one pooled requests.Session
+# shared by a thread pool - the same client setup as the GitHub importer.
+# A semaphore per host keeps us from hammering one site, HEAD is tried
+# first and GET (streamed, body not read) is used when a server refuses
+# HEAD, and results are kept in a TTL cache so reruns and overlapping
+# profiles don't re-check the same URL.
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from caching import LRU
+
+# statuses some servers send instead of answering HEAD properly
+HEAD_FALLBACK = {400, 403, 404, 405, 501}
+# bot walls and rate limits say nothing about whether the page exists
+UNVERIFIED = {401, 429, 999}
+USER_AGENT = 'Mozilla/5.0 (compatible; readme-maker-linkcheck/1.0)'
+
+def url_text(value):
+    # batch files aren't validated, so anything but text counts as no URL
+    return value.strip() if isinstance(value, str) else ''
+
+def collect_urls(profile):
+    # (where, url) for every checkable URL, in document order
+    for i, s in enumerate(profile.get('socials') or []):
+        yield f'socials[{i}]', url_text(s.get('url') if isinstance(s, dict) else None)
+    for i, p in enumerate(profile.get('projects') or []):
+        links = p.get('links') if isinstance(p, dict) else None
+        for j, link in enumerate(links if isinstance(links, list) else []):
+            yield f'projects[{i}].links[{j}]', url_text(link)
+    for field in ('github', 'linkedin'):
+        yield field, url_text(profile.get(field))
+
+def host_of(url):
+    # '' when the URL can't be parsed (an unclosed '[' in the host, ...)
+    try:
+        return urlsplit(url).netloc.lower()
+    except ValueError:
+        return ''
+
+def checkable(url):
+    # malformed http(s) URLs count too; check() reports them as broken
+    return url.lower().startswith(('http://', 'https://'))
+
+def interleave_by_host(urls):
+    # round-robin over hosts, so a profile full of github.com links doesn't
+    # park every worker on that host's semaphore while other hosts wait
+    by_host = {}
+    for url in urls:
+        by_host.setdefault(host_of(url), []).append(url)
+    queues = list(by_host.values())
+    return [q[i] for i in range(max(map(len, queues), default=0)) for q in queues if i < len(q)]
+
+def make_session(pool_size=64):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+class LinkChecker:
+    def __init__(self, workers=32, per_host=4, timeout=8, ttl=3600, maxsize=20000, session=None):
+        self.workers = workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.ttl = ttl
+        self.session = session or make_session(pool_size=workers)
+        self.cache = LRU(maxsize)
+        self._hosts = {}
+        self._lock = Lock()
+
+    def _host_slot(self, url):
+        host = host_of(url)
+        with self._lock:
+            slot = self._hosts.get(host)
+            if slot is None:
+                slot = self._hosts[host] = BoundedSemaphore(self.per_host)
+        return slot
+
+    def _request(self, method, url):
+        r = self.session.request(method, url, allow_redirects=True, timeout=self.timeout, stream=True)
+        r.close()
+        return r
+
+    def check(self, url):
+        cached = self.cache.get(url)
+        if cached is not None and time.time() - cached['checked_at'] < self.ttl:
+            return cached
+        started = time.perf_counter()
+        result = {'url': url, 'state': 'broken', 'status': None, 'method': 'HEAD', 'final_url': url, 'error': ''}
+        try:
+            if not host_of(url):
+                raise requests.exceptions.InvalidURL(f'malformed URL: {url}')
+            with self._host_slot(url):
+                r = self._request('HEAD', url)
+                if r.status_code in HEAD_FALLBACK:
+                    result['method'] = 'GET'
+                    r = self._request('GET', url)
+            result['status'] = r.status_code
+            result['final_url'] = r.url
+            if r.status_code < 400:
+                result['state'] = 'ok'
+            elif r.status_code in UNVERIFIED:
+                result['state'] = 'unverified'
+        except requests.RequestException as e:
+            result['error'] = f'{type(e).__name__}: {e}'
+        result['elapsed'] = time.perf_counter() - started
+        result['checked_at'] = time.time()
+        self.cache.put(url, result)
+        return result
+
+    def check_many(self, urls):
+        # url -> result; duplicates are checked once
+        unique = interleave_by_host(dict.fromkeys(u for u in urls if checkable(u)))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(unique))) as pool:
+            return dict(zip(unique, pool.map(self.check, unique)))
+
+    def check_profile(self, profile):
+        # [(where, url, result)] for every checkable URL in the profile
+        found = [(where, url) for where, url in collect_urls(profile) if checkable(url)]
+        results = self.check_many(url for _, url in found)
+        return [(where, url, results[url]) for where, url in found]
+
+# -------------------- CLI --------------------
+def main(argv=None):
+    from batch_render import iter_profiles
+
+    ap = argparse.ArgumentParser(description='Check every link in a batch of profiles.')
+    ap.add_argument('input', help='profiles .jsonl file or presets.json')
+    ap.add_argument('--workers', type=int, default=64, help='concurrent requests')
+    ap.add_argument('--per-host', type=int, default=4, help='concurrent requests per host')
+    ap.add_argument('--timeout', type=float, default=8.0)
+    ap.add_argument('--json', help='write every result to this file')
+    args = ap.parse_args(argv)
+
+    checker = LinkChecker(workers=args.workers, per_host=args.per_host, timeout=args.timeout)
+    profiles = [(key, list(collect_urls(profile))) for key, profile in iter_profiles(args.input)]
+    start = time.perf_counter()
+    results = checker.check_many(url for _, found in profiles for _, url in found)
+    elapsed = time.perf_counter() - start
+
+    broken = 0
+    report = {}
+    for key, found in profiles:
+        rows = [dict(results[url], where=where) for where, url in found if url in results]
+        report[key] = rows
+        for row in rows:
+            if row['state'] != 'ok':
+                broken += row['state'] == 'broken'
+                print(f"{key}: {row['where']} {row['url']} -> {row['state']} "
+                      f"{row['status'] or row['error']}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    print(f'checked {len(results)} unique URLs from {len(profiles)} profiles in {elapsed:.2f}s — '
+          f'{broken} broken', file=sys.stderr)
+    return 1 if broken else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,154 @@
+# Local SVG badges and GitHub stats cards.
+#
+# The fancy template normally points every tech badge at shields.io and the
+# highlights at github-readme-stats, so each README view waits on those
+# services. With an AssetStore the renderer instead emits relative links to
+# SVGs drawn here: badges from the tech name, cards from the `github_stats`
+# that github_import.build_profile() computes. Files are content-addressed
+# (<kind>-<hash>.svg), so a badge shared by many READMEs is written once.
+import os
+from html import escape
+from itertools import count
+from threading import Lock
+
+from caching import LRU, atomic_write, digest
+
+# radical-ish palette, same look as the remote cards
+THEME = {'bg': '#141321', 'border': '#e4e2e2', 'title': '#fe428e', 'text': '#a9fef7', 'icon': '#f8d847'}
+
+LANG_COLORS = {
+    'python': '#3776ab', 'javascript': '#f7df1e', 'typescript': '#3178c6', 'java': '#b07219',
+    'c': '#555555', 'c++': '#f34b7d', 'c#': '#178600', 'go': '#00add8', 'rust': '#dea584',
+    'ruby': '#701516', 'php': '#4f5d95', 'kotlin': '#a97bff', 'swift': '#f05138', 'html': '#e34c26',
+    'css': '#563d7c', 'shell': '#89e051', 'jupyter notebook': '#da5b0b', 'dart': '#00b4ab',
+}
+
+def color_for(name):
+    color = LANG_COLORS.get(name.lower())
+    if color:
+        return color
+    # stable but varied colour for everything else
+    h = int(digest(name.lower())[:6], 16)
+    r, g, b = (h >> 16) & 0xff, (h >> 8) & 0xff, h & 0xff
+    return f'#{r // 2 + 40:02x}{g // 2 + 40:02x}{b // 2 + 40:02x}'
+
+def text_width(text, char=7.2):
+    # no font metrics offline; wide/narrow glyphs are close enough for badges
+    narrow = sum(1 for c in text if c in 'fijlrtI1 .,:;|!\'')
+    return (len(text) - narrow) * char + narrow * char * 0.5
+
+# -------------------- SVG --------------------
+def badge_svg(name):
+    label = name.upper()
+    width = int(text_width(label) + 24)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="28" role="img" aria-label="{escape(name)}">'
+        f'<title>{escape(name)}</title>'
+        f'<rect width="{width}" height="28" fill="{color_for(name)}"/>'
+        f'<text x="{width / 2:.1f}" y="18" fill="#fff" text-anchor="middle" '
+        f'font-family="Verdana,Geneva,DejaVu Sans,sans-serif" font-size="10" font-weight="bold" letter-spacing="1">'
+        f'{escape(label)}</text></svg>'
+    )
+
+def _card(title, height, body):
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="450" height="{height}" viewBox="0 0 450 {height}" role="img">'
+        f'<title>{escape(title)}</title>'
+        f'<rect x="0.5" y="0.5" rx="4.5" width="449" height="{height - 1}" fill="{THEME["bg"]}" stroke="{THEME["border"]}"/>'
+        f'<text x="25" y="35" fill="{THEME["title"]}" font-family="Segoe UI,Ubuntu,sans-serif" font-size="18" '
+        f'font-weight="600">{escape(title)}</text>'
+        f'<g font-family="Segoe UI,Ubuntu,sans-serif" font-size="14" fill="{THEME["text"]}">{body}</g></svg>'
+    )
+
+def stats_card_svg(stats):
+    who = stats.get('name') or stats.get('login') or 'GitHub'
+    rows = [
+        ('Total stars', stats.get('stars', 0)),
+        ('Total forks', stats.get('forks', 0)),
+        ('Public repos', stats.get('public_repos', 0)),
+        ('Followers', stats.get('followers', 0)),
+    ]
+    body = ''.join(
+        f'<circle cx="31" cy="{66 + i * 28}" r="4" fill="{THEME["icon"]}"/>'
+        f'<text x="45" y="{71 + i * 28}">{escape(label)}:</text>'
+        f'<text x="300" y="{71 + i * 28}" font-weight="700">{value:,}</text>'
+        for i, (label, value) in enumerate(rows)
+    )
+    return _card(f"{who}'s GitHub Stats", 70 + len(rows) * 28, body)
+
+def langs_card_svg(stats, top=6):
+    langs = sorted((stats.get('languages') or {}).items(), key=lambda kv: (-kv[1], kv[0]))[:top]
+    total = sum(n for _, n in langs) or 1
+    parts, x = [], 25.0
+    for lang, n in langs:
+        w = 400 * n / total
+        parts.append(f'<rect x="{x:.2f}" y="55" width="{w:.2f}" height="8" fill="{color_for(lang)}"/>')
+        x += w
+    for i, (lang, n) in enumerate(langs):
+        cx, cy = 25 + (i % 2) * 200, 90 + (i // 2) * 25
+        parts.append(f'<circle cx="{cx + 5}" cy="{cy - 5}" r="5" fill="{color_for(lang)}"/>'
+                     f'<text x="{cx + 16}" y="{cy}" font-size="12">{escape(lang)} {100 * n / total:.1f}%</text>')
+    if not langs:
+        parts.append('<text x="25" y="80" font-size="12">No language data</text>')
+    return _card('Most Used Languages', 80 + max(1, (len(langs) + 1) // 2) * 25, ''.join(parts))
+
+# -------------------- Store --------------------
+_store_ids = count(1)
+
+class AssetStore:
+    # root=None keeps files in memory (self.files) for the app to bundle;
+    # otherwise they are written under root. `prefix` is the link the
+    # README uses to reach root, e.g. 'assets' or '../assets' when many
+    # READMEs share one asset directory.
+    def __init__(self, root=None, prefix='assets'):
+        self.root = root
+        self.prefix = prefix.rstrip('/')
+        self.files = {}
+        self._svgs = LRU(4096)
+        self._written = set()
+        self._lock = Lock()
+        self._token = next(_store_ids)
+
+    def __repr__(self):
+        # part of the renderer's section cache key: output depends on where
+        # links point and on which store actually holds the files. id() is
+        # reused once a store is freed, so in-memory stores get a counter
+        return f'AssetStore({self.root or self._token!r}, {self.prefix!r})'
+
+    def add(self, kind, svg):
+        name = f'{kind}-{digest(svg)[:16]}.svg'
+        with self._lock:
+            fresh = name not in self._written
+            self._written.add(name)
+        if fresh:
+            data = svg.encode('utf-8')
+            if self.root is None:
+                self.files[name] = data
+            elif not os.path.exists(os.path.join(self.root, name)):
+                atomic_write(os.path.join(self.root, name), data)
+        return f'{self.prefix}/{name}'
+
+    def read(self, name):
+        if self.root is None:
+            return self.files[name]
+        with open(os.path.join(self.root, name), 'rb') as f:
+            return f.read()
+
+    def _svg(self, key, fn, *args):
+        svg = self._svgs.get(key)
+        if svg is None:
+            svg = fn(*args)
+            self._svgs.put(key, svg)
+        return svg
+
+    def badge(self, name):
+        return self.add('badge', self._svg(('badge', name), badge_svg, name))
+
+    def badge_md(self, name):
+        return f'![{name}]({self.badge(name)})'
+
+    def stats_card(self, stats):
+        return self.add('stats', stats_card_svg(stats))
+
+    def langs_card(self, stats):
+        return self.add('langs', langs_card_svg(stats))
@@ -0,0 +1,110 @@
+# Lottie animations are decoration, so they must never hold up a rerun.
+# get() answers immediately from (in order) the in-memory cache, the disk
+# cache or the bundled placeholder in assets/lottie/ (hand-made stand-ins,
+# not copies of the CDN animations), and refreshes stale or missing
+# entries on a background thread. A failed fetch (offline, CDN down) isn't
+# retried for RETRY_AFTER seconds, so reruns don't each queue another
+# request that is going to time out.
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from caching import CACHE_DIR, DiskCache
+
+ANIMATIONS = {
+    'projects': 'https://assets7.lottiefiles.com/packages/lf20_touohxv0.json',
+    'header': 'https://assets7.lottiefiles.com/packages/lf20_jcikwtux.json',
+}
+BUNDLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'lottie')
+TTL = 24 * 3600
+RETRY_AFTER = 5 * 60
+
+def load_bundled(name):
+    try:
+        with open(os.path.join(BUNDLE_DIR, f'{name}.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def fetch_json(url, timeout=8):
+    import requests
+    r = requests.get(url, timeout=timeout)
+    if r.status_code == 200:
+        return r.json()
+    return None
+
+class LottieLoader:
+    def __init__(self, disk_dir=None, ttl=TTL, timeout=8, fetch=fetch_json, retry_after=RETRY_AFTER):
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.timeout = timeout
+        self.fetch = fetch
+        self.disk = DiskCache(disk_dir, suffix='.json', ttl=None) if disk_dir else None
+        self._memory = {}  # url -> (fetched_at, animation)
+        self._inflight = set()
+        self._failed = {}  # url -> time of the last failed fetch
+        self._lock = Lock()
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='lottie')
+
+    def get(self, url, name=None):
+        now = time.time()
+        entry = self._memory.get(url)
+        if entry is None:
+            entry = self._from_disk(url)
+        if entry is None or now - entry[0] > self.ttl:
+            self._refresh(url)
+        if entry is not None:
+            return entry[1]
+        return load_bundled(name) if name else None
+
+    def get_named(self, name):
+        return self.get(ANIMATIONS[name], name=name)
+
+    def _from_disk(self, url):
+        if self.disk is None:
+            return None
+        path = self.disk.path(url)
+        raw = self.disk.get(url)
+        if raw is None:
+            return None
+        try:
+            entry = (os.path.getmtime(path), json.loads(raw))
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._memory.setdefault(url, entry)
+        return entry
+
+    def _refresh(self, url):
+        with self._lock:
+            if url in self._inflight or time.time() - self._failed.get(url, 0) < self.retry_after:
+                return
+            self._inflight.add(url)
+        self._pool.submit(self._fetch, url)
+
+    def _fetch(self, url):
+        try:
+            animation = self.fetch(url, timeout=self.timeout)
+        except Exception:
+            animation = None
+        with self._lock:
+            self._inflight.discard(url)
+            if animation is not None:
+                self._memory[url] = (time.time(), animation)
+                self._failed.pop(url, None)
+            else:
+                self._failed[url] = time.time()
+        if animation is not None and self.disk is not None:
+            self.disk.put(url, json.dumps(animation).encode('utf-8'))
+        return animation
+
+    def wait(self, timeout=None):
+        # test/batch helper: block until queued refreshes have finished
+        deadline = None if timeout is None else time.time() + timeout
+        while self._inflight and (deadline is None or time.time() < deadline):
+            time.sleep(0.01)
+
+loader = LottieLoader(disk_dir=CACHE_DIR or os.path.join(tempfile.gettempdir(), 'readme-maker-cache'))
@@ -0,0 +1,183 @@
+# Bulk preset import/export as JSONL.
+#
+#   python preset_io.py import employees.jsonl --workers 8
+#   python preset_io.py import employees.jsonl --resume     # carry on after a crash or Ctrl-C
+#   python preset_io.py export presets.jsonl
+#
+# One profile per line, the same shape batch_render.py reads. The preset
+# name is the line's "id" (export writes one), else its GitHub login, else
+# its name, else "profile-<line>"; a later line with the same name wins.
+#
+# The file is streamed in chunks of lines that a process pool parses and
+# validates (profile_model.Profile), with a bounded number of chunks in
+# flight. Chunks are committed in file order, each in one transaction
+# together with the byte offset it ends at, so --resume continues right
+# after the last committed chunk and memory doesn't grow with the file.
+# Bad lines are reported with their line number and skipped.
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from batch_render import github_login
+from preset_store import PRESETS_DB, PresetStore
+from profile_model import Profile, ProfileError
+
+CHUNK_LINES = 1000
+
+def preset_name(key, profile, has_name, lineno):
+    # profile is already validated, so github/name are text here
+    if isinstance(key, bool) or not isinstance(key, (str, int, type(None))):
+        raise ProfileError([('id', f'expected text or a number, got {type(key).__name__}')])
+    if key not in (None, ''):
+        return str(key)
+    return github_login(profile.github) or (has_name and profile.name) or f'profile-{lineno}'
+
+# -------------------- Worker --------------------
+def validate_chunk(first_lineno, lines):
+    # ([(name, preset JSON)], [(lineno, error)]) for raw lines starting at first_lineno
+    presets, errors = [], []
+    for lineno, raw in enumerate(lines, first_lineno):
+        if not raw.strip():
+            continue
+        try:
+            profile = json.loads(raw)
+            if not isinstance(profile, dict):
+                raise ProfileError([('', f'expected an object, got {type(profile).__name__}')])
+            key = profile.pop('id', None)
+            validated = Profile.from_dict(profile)
+            name = preset_name(key, validated, bool(profile.get('name')), lineno)
+            presets.append((name, json.dumps(validated.to_dict(), ensure_ascii=False)))
+        except ValueError as e:  # bad JSON or a ProfileError
+            errors.append((lineno, str(e)))
+        except Exception as e:  # anything else one line can trigger (e.g. nesting too deep) skips just that line
+            errors.append((lineno, f'{type(e).__name__}: {e}'))
+    return presets, errors
+
+# -------------------- Import --------------------
+def iter_chunks(f, first_lineno=1, offset=0, chunk_lines=CHUNK_LINES):
+    # (first line number, raw lines, byte offset after them) from a binary file
+    lines = []
+    for raw in f:
+        lines.append(raw)
+        offset += len(raw)
+        if len(lines) >= chunk_lines:
+            yield first_lineno, lines, offset
+            first_lineno += len(lines)
+            lines = []
+    if lines:
+        yield first_lineno, lines, offset
+
+def resume_key(path):
+    return f'import:{os.path.abspath(path)}'
+
+def import_jsonl(f, store, workers=None, chunk_lines=CHUNK_LINES, max_in_flight=None, checkpoint=None,
+                 resume=False, on_error=None):
+    # f: binary file object. checkpoint: meta key progress is saved under
+    # (None = don't), read back when resume is set. workers=0 validates in
+    # this process (the app does that; it has no pool to hand chunks to).
+    state = {'offset': 0, 'lineno': 1, 'imported': 0, 'failed': 0}
+    if checkpoint and resume:
+        saved = store.get_meta(checkpoint)
+        if saved:
+            state.update(json.loads(saved))
+    resumed_from = state['lineno']
+    f.seek(state['offset'])
+    start = time.perf_counter()
+
+    def commit(presets, errors, next_lineno, offset):
+        state.update(offset=offset, lineno=next_lineno, imported=state['imported'] + len(presets),
+                     failed=state['failed'] + len(errors))
+        store.put_many(presets, meta={checkpoint: json.dumps(state)} if checkpoint else None)
+        for lineno, message in errors:
+            if on_error:
+                on_error(lineno, message)
+
+    chunks = iter_chunks(f, state['lineno'], state['offset'], chunk_lines)
+    if workers == 0:
+        for first, lines, offset in chunks:
+            commit(*validate_chunk(first, lines), first + len(lines), offset)
+    else:
+        workers = workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or workers * 2
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # results are committed in submission order, so the checkpoint
+            # only ever covers a contiguous prefix of the file
+            window = deque()
+            for first, lines, offset in chunks:
+                window.append((pool.submit(validate_chunk, first, lines), first + len(lines), offset))
+                if len(window) >= max_in_flight:
+                    fut, next_lineno, end = window.popleft()
+                    commit(*fut.result(), next_lineno, end)
+            while window:
+                fut, next_lineno, end = window.popleft()
+                commit(*fut.result(), next_lineno, end)
+
+    elapsed = time.perf_counter() - start
+    lines = state['lineno'] - resumed_from
+    return {'imported': state['imported'], 'failed': state['failed'], 'lines': lines, 'resumed_from': resumed_from,
+            'seconds': elapsed, 'lines_per_sec': lines / elapsed if elapsed > 0 else 0.0}
+
+# -------------------- Export --------------------
+def export_jsonl(store, sink):
+    # streams every preset to a binary sink, one line each, name as "id"
+    n = 0
+    for name, preset in store.items():
+        row = {'id': name, **preset}
+        row['id'] = name
+        sink.write(json.dumps(row, ensure_ascii=False).encode('utf-8') + b'\n')
+        n += 1
+    return n
+
+# -------------------- CLI --------------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Import or export presets as JSONL.')
+    ap.add_argument('--db', default=PRESETS_DB, help='preset database')
+    sub = ap.add_subparsers(dest='command', required=True)
+    imp = sub.add_parser('import', help='load profiles from a .jsonl file into the preset store')
+    imp.add_argument('input')
+    imp.add_argument('--workers', type=int, default=None, help='validation processes (default: CPU count, 0 = inline)')
+    imp.add_argument('--chunk-lines', type=int, default=CHUNK_LINES, help='lines per chunk / transaction')
+    imp.add_argument('--resume', action='store_true', help='continue after the last committed chunk')
+    imp.add_argument('--errors', help='write bad lines as JSONL {"line": n, "error": "..."} to this file')
+    exp = sub.add_parser('export', help='write every preset to a .jsonl file')
+    exp.add_argument('output')
+    args = ap.parse_args(argv)
+
+    store = PresetStore(args.db)
+    if args.command == 'export':
+        with open(args.output, 'wb') as f:
+            n = export_jsonl(store, f)
+        print(f'exported {n} presets to {args.output}', file=sys.stderr)
+        return 0
+
+    err_file = open(args.errors, 'w', encoding='utf-8') if args.errors else None
+    shown = 0
+
+    def on_error(lineno, message):
+        nonlocal shown
+        if err_file:
+            err_file.write(json.dumps({'line': lineno, 'error': message}, ensure_ascii=False) + '\n')
+        if shown < 20:
+            print(f'{args.input}:{lineno}: {message}', file=sys.stderr)
+            shown += 1
+
+    try:
+        with open(args.input, 'rb') as f:
+            stats = import_jsonl(f, store, workers=args.workers, chunk_lines=args.chunk_lines,
+                                 checkpoint=resume_key(args.input), resume=args.resume, on_error=on_error)
+    except KeyboardInterrupt:
+        print('interrupted — committed chunks are kept; rerun with --resume to continue', file=sys.stderr)
+        return 130
+    finally:
+        if err_file:
+            err_file.close()
+    print(f"imported {stats['imported']} presets ({stats['failed']} bad lines) from line {stats['resumed_from']} "
+          f"in {stats['seconds']:.2f}s — {stats['lines_per_sec']:.0f} lines/sec", file=sys.stderr)
+    return 1 if stats['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
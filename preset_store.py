@@ -0,0 +1,182 @@
+# Preset storage.
+#
+# Presets live in a SQLite database (WAL mode) instead of one presets.json
+# that had to be parsed on every rerun and rewritten on every save. Each
+# write is its own transaction and bumps a version counter; the in-process
+# cache of names and presets is dropped whenever that counter moves, so
+# several Streamlit sessions (or processes) always see each other's saves.
+# The first time a store is opened it imports an existing presets.json.
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+PRESETS_DB = 'presets.db'
+PRESETS_FILE = 'presets.json'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS presets (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('version', '0');
+"""
+
+# -------------------- Legacy presets.json --------------------
+def load_presets(path=PRESETS_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_presets(presets, path=PRESETS_FILE):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(presets, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+# -------------------- SQLite store --------------------
+class PresetStore:
+    def __init__(self, path=PRESETS_DB, migrate_from=None, timeout=10):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._version = None
+        self._names = None
+        self._presets = {}
+        self._conn().executescript(SCHEMA)
+        if migrate_from:
+            self.migrate_json(migrate_from)
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _tx(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent
+        # writers queue (up to `timeout`) instead of failing mid-transaction
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def _bump(self, db):
+        db.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'version'")
+
+    def version(self):
+        row = self._conn().execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return int(row[0])
+
+    def _check_cache(self):
+        version = self.version()
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._names = None
+                self._presets = {}
+
+    # ---- reads
+    def names(self):
+        self._check_cache()
+        if self._names is None:
+            rows = self._conn().execute('SELECT name FROM presets ORDER BY name').fetchall()
+            self._names = [r[0] for r in rows]
+        return list(self._names)
+
+    def get(self, name, default=None):
+        self._check_cache()
+        if name in self._presets:
+            return json.loads(self._presets[name])
+        row = self._conn().execute('SELECT data FROM presets WHERE name = ?', (name,)).fetchone()
+        if row is None:
+            return default
+        self._presets[name] = row[0]
+        return json.loads(row[0])
+
+    def __contains__(self, name):
+        return self._conn().execute('SELECT 1 FROM presets WHERE name = ?', (name,)).fetchone() is not None
+
+    def __len__(self):
+        return self._conn().execute('SELECT COUNT(*) FROM presets').fetchone()[0]
+
+    def items(self):
+        for name, data in self._conn().execute('SELECT name, data FROM presets ORDER BY name'):
+            yield name, json.loads(data)
+
+    def get_meta(self, key, default=None):
+        row = self._conn().execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return default if row is None else row[0]
+
+    # ---- writes
+    def put(self, name, preset):
+        data = json.dumps(preset, ensure_ascii=False)
+        with self._tx() as db:
+            db.execute('INSERT INTO presets (name, data, updated_at) VALUES (?, ?, ?) '
+                       'ON CONFLICT(name) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at',
+                       (name, data, time.time()))
+            self._bump(db)
+
+    def put_many(self, presets, meta=None):
+        # presets: (name, preset) pairs; a preset may already be JSON text.
+        # meta: {key: value} written in the same transaction, e.g. a bulk
+        # import's checkpoint, so it can never get ahead of the data
+        now = time.time()
+        rows = [(name, p if isinstance(p, str) else json.dumps(p, ensure_ascii=False), now) for name, p in presets]
+        if not rows and not meta:
+            return 0
+        with self._tx() as db:
+            db.executemany('INSERT INTO presets (name, data, updated_at) VALUES (?, ?, ?) '
+                           'ON CONFLICT(name) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at',
+                           rows)
+            db.executemany('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (meta or {}).items())
+            if rows:
+                self._bump(db)
+        return len(rows)
+
+    def delete(self, name):
+        with self._tx() as db:
+            deleted = db.execute('DELETE FROM presets WHERE name = ?', (name,)).rowcount
+            if deleted:
+                self._bump(db)
+        return bool(deleted)
+
+    # ---- migration
+    def migrate_json(self, json_path=PRESETS_FILE):
+        # one-time import; the JSON file is left in place untouched
+        if not os.path.exists(json_path):
+            return 0
+        marker = f'migrated:{os.path.abspath(json_path)}'
+        conn = self._conn()
+        if conn.execute('SELECT 1 FROM meta WHERE key = ?', (marker,)).fetchone():
+            return 0
+        presets = load_presets(json_path)
+        with self._tx() as db:
+            if db.execute('SELECT 1 FROM meta WHERE key = ?', (marker,)).fetchone():
+                return 0
+            now = time.time()
+            db.executemany('INSERT OR IGNORE INTO presets (name, data, updated_at) VALUES (?, ?, ?)',
+                           [(name, json.dumps(p, ensure_ascii=False), now) for name, p in presets.items()])
+            db.execute('INSERT INTO meta (key, value) VALUES (?, ?)', (marker, str(now)))
+            self._bump(db)
+        return len(presets)
@@ -0,0 +1,188 @@
+# Profile model.
+#
+# The app used to rebuild the profile dict from st.session_state in three
+# places (Save preset, Quick Save and the final `data`), re-splitting tech
+# and certifications from the raw text areas each time. Profile is the one
+# place that happens: a slotted value with the renderer's FIELDS, checked
+# on construction, lists frozen into tuples, == on contents and a stable
+# content digest (sha256 of canonical JSON) that caches, preset dedup and
+# "has anything changed?" checks can key on. Tuples of values instead of
+# nested dicts/lists also keep large batches of profiles smaller.
+#
+# to_dict() gives back the plain JSON-shaped dict the renderer, presets and
+# batch files use.
+import hashlib
+import json
+
+from renderer import FIELDS
+
+TEXT_FIELDS = tuple(k for k, v in FIELDS.items() if isinstance(v, str))
+SOCIAL_KEYS = ('label', 'url')
+PROJECT_KEYS = ('name', 'links', 'tags', 'desc')
+# text fields where a bare number in JSON is fine (8.5, 5551234)
+NUMERIC_TEXT = ('cpi', 'phone')
+
+# profile field -> st.session_state key the form keeps it under
+FORM_KEYS = {
+    'name': 'form_name', 'title': 'form_title', 'about': 'form_about', 'socials': 'form_socials',
+    'tech': 'form_tech', 'education': 'form_education', 'cpi': 'form_cpi', 'certifications': 'form_certs',
+    'projects': 'projects', 'phone': 'form_phone', 'email': 'form_email', 'linkedin': 'form_linkedin',
+    'github': 'form_github', 'github_stats': 'github_stats',
+}
+
+class ProfileError(ValueError):
+    # errors: [(where, message)], where is a path like 'projects[2].links'
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('; '.join(f'{where}: {message}' if where else message for where, message in errors))
+
+# -------------------- Field parsing --------------------
+def split_items(value, sep, where, errors):
+    # tech is comma-separated and certifications one per line in the form;
+    # lists are accepted as they are
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        value = value.split(sep) if sep else value.splitlines()
+    if not isinstance(value, (list, tuple)):
+        errors.append((where, f'expected a list or text, got {type(value).__name__}'))
+        return ()
+    items = []
+    for i, item in enumerate(value):
+        if not isinstance(item, str):
+            errors.append((f'{where}[{i}]', f'expected text, got {type(item).__name__}'))
+        elif item.strip():
+            items.append(item.strip())
+    return tuple(items)
+
+def text(value, where, errors, default=''):
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return value
+    if where in NUMERIC_TEXT and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    errors.append((where, f'expected text, got {type(value).__name__}'))
+    return default
+
+def records(value, keys, where, errors, parse):
+    if value is None:
+        return ()
+    if not isinstance(value, (list, tuple)):
+        errors.append((where, f'expected a list, got {type(value).__name__}'))
+        return ()
+    items = []
+    for i, item in enumerate(value):
+        if not isinstance(item, dict):
+            errors.append((f'{where}[{i}]', f'expected an object, got {type(item).__name__}'))
+            continue
+        items.append(tuple(parse(k, item.get(k), f'{where}[{i}].{k}', errors) for k in keys))
+    return tuple(items)
+
+def social_value(key, value, where, errors):
+    return text(value, where, errors)
+
+def project_value(key, value, where, errors):
+    if key == 'links':
+        # the table editor keeps links space-separated
+        return split_items(value.split() if isinstance(value, str) else value, None, where, errors)
+    if key == 'tags' and isinstance(value, (list, tuple)):
+        return ', '.join(split_items(value, None, where, errors))
+    return text(value, where, errors)
+
+def stats(value, where, errors):
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        errors.append((where, f'expected an object, got {type(value).__name__}'))
+        return {}
+    return json.loads(json.dumps(value))  # private, JSON-clean copy
+
+# -------------------- Model --------------------
+class Profile:
+    __slots__ = tuple(FIELDS) + ('extra', '_digest')
+
+    def __init__(self, /, **fields):
+        # unknown keys (batch 'id', 'qr_url', ...) are kept in .extra
+        errors = []
+        for name in TEXT_FIELDS:
+            object.__setattr__(self, name, text(fields.pop(name, None), name, errors, FIELDS[name]))
+        object.__setattr__(self, 'tech', split_items(fields.pop('tech', None), ',', 'tech', errors))
+        object.__setattr__(self, 'certifications',
+                           split_items(fields.pop('certifications', None), None, 'certifications', errors))
+        object.__setattr__(self, 'socials',
+                           records(fields.pop('socials', None), SOCIAL_KEYS, 'socials', errors, social_value))
+        object.__setattr__(self, 'projects',
+                           records(fields.pop('projects', None), PROJECT_KEYS, 'projects', errors, project_value))
+        object.__setattr__(self, 'github_stats', stats(fields.pop('github_stats', None), 'github_stats', errors))
+        try:
+            extra = json.loads(json.dumps(fields))
+        except (TypeError, ValueError) as e:
+            errors.append(('extra', f'not JSON-serializable: {e}'))
+            extra = {}
+        object.__setattr__(self, 'extra', extra)
+        object.__setattr__(self, '_digest', None)
+        if errors:
+            raise ProfileError(errors)
+
+    @classmethod
+    def from_dict(cls, data):
+        if not isinstance(data, dict):
+            raise ProfileError([('', f'expected an object, got {type(data).__name__}')])
+        return cls(**data)
+
+    @classmethod
+    def from_state(cls, state, **overrides):
+        # the profile as the form currently holds it; fields the form has
+        # no widget for (objective) come from overrides
+        fields = {name: state.get(key) for name, key in FORM_KEYS.items() if state.get(key) is not None}
+        fields.update(overrides)
+        return cls(**fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Profile is immutable; use replace()')
+
+    def replace(self, /, **changes):
+        return Profile(**dict(self.to_dict(), **changes))
+
+    def to_dict(self):
+        # a fresh dict every call, in FIELDS order, safe for the caller to edit
+        data = {name: getattr(self, name) for name in FIELDS}
+        data['socials'] = [dict(zip(SOCIAL_KEYS, s)) for s in self.socials]
+        data['tech'] = list(self.tech)
+        data['certifications'] = list(self.certifications)
+        data['projects'] = [dict(zip(PROJECT_KEYS, (name, list(links), tags, desc)))
+                            for name, links, tags, desc in self.projects]
+        data['github_stats'] = json.loads(json.dumps(self.github_stats))
+        data.update(json.loads(json.dumps(self.extra)))
+        return data
+
+    @property
+    def digest(self):
+        # same content -> same digest, in any process and across runs
+        if self._digest is None:
+            blob = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+            object.__setattr__(self, '_digest', hashlib.sha256(blob.encode('utf-8')).hexdigest())
+        return self._digest
+
+    def __eq__(self, other):
+        # by digest, like __hash__: == on the values would call extra
+        # {'x': 1} and {'x': 1.0} equal although they hash differently
+        if self is other:
+            return True
+        if type(other) is not Profile:
+            return NotImplemented
+        return self.digest == other.digest
+
+    def __hash__(self):
+        return int(self.digest[:16], 16)
+
+    def __repr__(self):
+        return f'Profile({self.name!r}, {self.digest[:12]})'
+
+    def __reduce__(self):
+        # slots + a raising __setattr__ need help to pickle (process pools)
+        return _from_dict, (self.to_dict(),)
+
+def _from_dict(data):
+    return Profile.from_dict(data)
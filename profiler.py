@@ -0,0 +1,118 @@
+# Per-rerun stage timings.
+#
+#   run = profiler.run()
+#   with run.stage('markdown'):
+#       md = generate_markdown(...)
+#   run.finish()
+#
+# Every stage duration goes into a rolling window (for percentiles) and a
+# running sum/count (for Prometheus). finish() also records the whole
+# rerun as the 'rerun' stage and, if a log path is set, appends the run as
+# one JSON line. The profiler is process-wide and thread-safe, so it
+# aggregates over all Streamlit sessions.
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[i]
+
+class Run:
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.started = time.perf_counter()
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - t0)
+
+    def record(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+        self.profiler.record(name, seconds)
+
+    def finish(self):
+        total = time.perf_counter() - self.started
+        self.profiler.record('rerun', total)
+        self.profiler.log_run(self.stages, total)
+        return total
+
+class Profiler:
+    def __init__(self, window=500, log_path=None):
+        self.window = window
+        self.log_path = log_path
+        self._samples = {}
+        self._sums = {}
+        self._counts = {}
+        self._lock = Lock()
+
+    def run(self):
+        return Run(self)
+
+    def record(self, name, seconds):
+        with self._lock:
+            if name not in self._samples:
+                self._samples[name] = deque(maxlen=self.window)
+                self._sums[name] = 0.0
+                self._counts[name] = 0
+            self._samples[name].append(seconds)
+            self._sums[name] += seconds
+            self._counts[name] += 1
+
+    def log_run(self, stages, total):
+        if not self.log_path:
+            return
+        line = json.dumps({'ts': time.time(), 'total': total, 'stages': stages})
+        with self._lock, open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+    def stats(self):
+        # {stage: {'count', 'mean', 'p50', 'p90', 'p99', 'max'}} over the window
+        with self._lock:
+            snapshot = {name: sorted(samples) for name, samples in self._samples.items()}
+            counts = dict(self._counts)
+        out = {}
+        for name, values in snapshot.items():
+            row = {'count': counts[name], 'mean': sum(values) / len(values) if values else 0.0}
+            for q in QUANTILES:
+                row[f'p{int(q * 100)}'] = percentile(values, q)
+            row['max'] = values[-1] if values else 0.0
+            out[name] = row
+        return out
+
+    def to_jsonl(self):
+        return ''.join(json.dumps(dict(stage=name, **row)) + '\n' for name, row in self.stats().items())
+
+    def to_prometheus(self, metric='readme_maker_stage_seconds'):
+        with self._lock:
+            snapshot = {name: sorted(samples) for name, samples in self._samples.items()}
+            sums = dict(self._sums)
+            counts = dict(self._counts)
+        lines = [f'# HELP {metric} Time spent in each stage of a Streamlit rerun.', f'# TYPE {metric} summary']
+        for name, values in sorted(snapshot.items()):
+            for q in QUANTILES:
+                lines.append(f'{metric}{{stage="{name}",quantile="{q}"}} {percentile(values, q):.6f}')
+            lines.append(f'{metric}_sum{{stage="{name}"}} {sums[name]:.6f}')
+            lines.append(f'{metric}_count{{stage="{name}"}} {counts[name]}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._sums.clear()
+            self._counts.clear()
+
+# README_MAKER_PROFILE_LOG appends one JSON line per rerun to that file
+profiler = Profiler(log_path=os.environ.get('README_MAKER_PROFILE_LOG') or None)
@@ -0,0 +1,219 @@
+# QR generation with a content-addressed cache. The same portfolio URL is
+# rendered on every rerun (and by every session), so encoded images are
+# kept in a bounded in-memory LRU and, when a cache directory is set, on
+# disk where other sessions/processes can reuse them.
+#
+# PNG and SVG are drawn straight from the module matrix: PNG as a 2-colour
+# palette image (1 bit per pixel), SVG as one path of horizontal runs. With
+# NumPy installed the mask-pattern scoring and the module raster work on
+# whole arrays; without it the same output is produced in pure Python.
+from functools import lru_cache
+from html import escape
+from io import BytesIO
+from itertools import groupby
+from threading import Lock
+
+import qrcode
+
+from caching import CACHE_DIR, LRU, DiskCache
+
+MIME_TYPES = {'PNG': 'image/png', 'SVG': 'image/svg+xml'}
+# part of every cache key; bump it when the bytes produced for the same
+# arguments change (2: 1-bit palette PNGs), so a shared cache directory
+# doesn't keep serving images from an older version
+CACHE_VERSION = 2
+
+@lru_cache(maxsize=None)
+def _numpy():
+    # optional speed-up, imported on first use
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+# -------------------- Matrix --------------------
+# dark:light:dark:light:dark = 1:1:3:1:1 next to 4 light modules
+FINDER_LIKE = ((1, 0, 1, 1, 1, 0, 1, 0, 0, 0, 0), (0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1))
+
+def lost_point(np, modules):
+    # qrcode.util.lost_point() (ISO 18004 mask penalties) on a bool array:
+    # same score, so the same mask pattern wins
+    m = np.asarray(modules, dtype=bool)
+    n = len(m)
+    points = 0
+    for grid in (m, m.T):
+        # N1: runs of >= 5 same-colour modules score length - 2
+        change = np.ones((n, n + 1), dtype=bool)
+        change[:, 1:n] = grid[:, 1:] != grid[:, :-1]
+        runs = np.diff(np.flatnonzero(change))
+        runs = runs[runs >= 5]
+        points += int((runs - 2).sum())
+        # N3: 1:1:3:1:1 finder-like patterns with 4 light modules beside them
+        for pattern in FINDER_LIKE:
+            found = np.ones((n, n - 10), dtype=bool)
+            for k, dark in enumerate(pattern):
+                found &= grid[:, k:n - 10 + k] == dark
+            points += 40 * int(found.sum())
+    # N2: 2x2 blocks of one colour
+    block = (m[:-1, :-1] == m[:-1, 1:]) & (m[:-1, :-1] == m[1:, :-1]) & (m[:-1, :-1] == m[1:, 1:])
+    points += 3 * int(block.sum())
+    # N4: every 5% away from half dark
+    percent = float(m.sum()) / (n ** 2)
+    points += int(abs(percent * 100 - 50) / 5) * 10
+    return points
+
+# qrcode.util.mask_func() as array expressions (i = row, j = column)
+MASKS = (
+    lambda i, j: (i + j) % 2 == 0,
+    lambda i, j: i % 2 == 0,
+    lambda i, j: j % 3 == 0,
+    lambda i, j: (i + j) % 3 == 0,
+    lambda i, j: (i // 2 + j // 3) % 2 == 0,
+    lambda i, j: (i * j) % 2 + (i * j) % 3 == 0,
+    lambda i, j: ((i * j) % 2 + (i * j) % 3) % 2 == 0,
+    lambda i, j: ((i * j) % 3 + (i + j) % 2) % 2 == 0,
+)
+
+class QRCode(qrcode.QRCode):
+    # qrcode lays the data out and scores it once per mask pattern, all in
+    # pure Python. Test layouts only differ in the data cells (type info is
+    # blank while testing), so with NumPy we lay out once and derive the
+    # other seven by XOR-ing the mask difference, then score them as arrays.
+    def map_data(self, data, mask_pattern):
+        # the cells still empty here are exactly the ones map_data fills
+        self._data_cells = bytes(v is None for row in self.modules for v in row)
+        super().map_data(data, mask_pattern)
+
+    def best_mask_pattern(self):
+        np = _numpy()
+        if np is None:
+            return super().best_mask_pattern()
+        self.makeImpl(True, 0)
+        first = np.array(self.modules, dtype=bool)
+        data_cells = np.frombuffer(self._data_cells, dtype=bool).reshape(first.shape)
+        i = np.arange(len(first), dtype=np.int32)[:, None]
+        j = i.T
+        mask0 = MASKS[0](i, j)
+        best = pattern = None
+        for n, fn in enumerate(MASKS):
+            points = lost_point(np, first ^ (data_cells & (mask0 ^ fn(i, j))))
+            if best is None or points < best:
+                best, pattern = points, n
+        return pattern
+
+def qr_matrix(url, border=2):
+    # rows of bools, quiet zone included
+    qr = QRCode(border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    return qr.get_matrix()
+
+# -------------------- Output --------------------
+def rasterize(matrix):
+    # one byte per module (0 light / 1 dark), row-major
+    np = _numpy()
+    if np is not None:
+        return np.asarray(matrix, dtype=np.uint8).tobytes()
+    return bytes(v for row in matrix for v in row)
+
+def qr_png(matrix, box_size=10, fill_color='black', back_color='white'):
+    from PIL import Image, ImageColor
+    n = len(matrix)
+    img = Image.frombytes('P', (n, n), rasterize(matrix))
+    img.putpalette(ImageColor.getrgb(back_color)[:3] + ImageColor.getrgb(fill_color)[:3])
+    # scale modules to boxes in C instead of building the pixels here
+    img = img.resize((n * box_size, n * box_size), Image.Resampling.NEAREST)
+    buf = BytesIO()
+    # a 2-entry palette is written as a 1-bit PNG
+    img.save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+def qr_svg(matrix, box_size=10, fill_color='black', back_color='white'):
+    # each row of dark runs is one stroked subpath of relative moves:
+    # "M<x> <y>.5h<run>m<gap> 0h<run>..."
+    n = len(matrix)
+    d = []
+    for y, row in enumerate(matrix):
+        end = None
+        pos = 0
+        for dark, group in groupby(row):
+            width = len(list(group))
+            if dark:
+                d.append(f'M{pos} {y}.5h{width}' if end is None else f'm{pos - end} 0h{width}')
+                end = pos + width
+            pos += width
+    size = n * box_size
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {n} {n}" '
+        f'shape-rendering="crispEdges"><rect width="{n}" height="{n}" fill="{escape(back_color)}"/>'
+        f'<path stroke="{escape(fill_color)}" d="{"".join(d)}"/></svg>'
+    ).encode('utf-8')
+
+def render_qr_pil(url, box_size=10, border=2, fill_color='black', back_color='white', fmt='PNG'):
+    # qrcode's own PIL image factory; used for formats other than PNG/SVG
+    qr = qrcode.QRCode(box_size=box_size, border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color=fill_color, back_color=back_color)
+    buf = BytesIO()
+    img.save(buf, format=fmt)
+    return buf.getvalue()
+
+def render_qr(url, box_size=10, border=2, fill_color='black', back_color='white', fmt='PNG'):
+    fmt = fmt.upper()
+    if fmt == 'PNG':
+        return qr_png(qr_matrix(url, border), box_size, fill_color, back_color)
+    if fmt == 'SVG':
+        return qr_svg(qr_matrix(url, border), box_size, fill_color, back_color)
+    return render_qr_pil(url, box_size, border, fill_color, back_color, fmt)
+
+class QRCache:
+    def __init__(self, maxsize=256, disk_dir=None):
+        self.memory = LRU(maxsize)
+        self.disk = DiskCache(disk_dir) if disk_dir else None
+        self._lock = Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, url, box_size=10, border=2, fill_color='black', back_color='white', fmt='PNG'):
+        key = (CACHE_VERSION, url, box_size, border, fill_color, back_color, fmt)
+        data = self.memory.get(key)
+        if data is not None:
+            self._count('memory_hits')
+            return data
+        if self.disk is not None:
+            data = self.disk.get(key)
+            if data is not None:
+                self._count('disk_hits')
+                self.memory.put(key, data)
+                return data
+        self._count('misses')
+        data = render_qr(url, box_size, border, fill_color, back_color, fmt)
+        self.memory.put(key, data)
+        if self.disk is not None:
+            self.disk.put(key, data)
+        return data
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self):
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'memory_entries': len(self.memory),
+        }
+
+    def clear(self):
+        self.memory.clear()
+        with self._lock:
+            self.memory_hits = self.disk_hits = self.misses = 0
+
+qr_cache = QRCache(disk_dir=CACHE_DIR or None)
+
+def make_qr_png(url, box_size=10, border=2, fill_color='black', back_color='white'):
+    return BytesIO(qr_cache.get(url, box_size, border, fill_color, back_color, 'PNG'))
@@ -0,0 +1,295 @@
+# Small HTTP service around the renderer, stdlib only.
+#
+#   python render_service.py --port 8700 --workers 4
+#
+#   POST /render  {"data": {...profile...}, "template": "fancy-animated",
+#                  "include_qr": false, "qr_filename": null}   -> text/markdown
+#   POST /qr      {"url": "...", "box_size": 10, "border": 2,
+#                  "format": "png"}                            -> image/png or image/svg+xml
+#   GET  /healthz                                               -> ok
+#   GET  /metrics                                               -> Prometheus text
+#
+# Connections are HTTP/1.1 keep-alive. Requests are queued and a batcher
+# hands them to a process pool in micro-batches (up to --max-batch jobs or
+# --batch-window ms, whichever comes first), so the per-job IPC overhead is
+# paid once per batch. When --max-pending jobs are already queued new work
+# is refused with 503 + Retry-After instead of piling up.
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from profiler import Profiler
+from renderer import TEMPLATES, generate_markdown
+
+MAX_BODY = 4 * 1024 * 1024
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 431: 'Request Header Fields Too Large', 500: 'Internal Server Error',
+           503: 'Service Unavailable'}
+
+ENDPOINTS = ('/render', '/qr', '/healthz', '/metrics')
+# qr.MIME_TYPES, without importing qrcode into the server process
+QR_FORMATS = {'PNG': 'image/png', 'SVG': 'image/svg+xml'}
+
+class BadRequest(Exception):
+    status = 400
+
+class PayloadTooLarge(BadRequest):
+    status = 413
+
+class HeaderTooLarge(BadRequest):
+    status = 431
+
+# -------------------- Worker side --------------------
+def init_worker():
+    # Ctrl-C is handled by the server, which shuts the pool down itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def run_job(kind, payload):
+    if kind == 'render':
+        md = generate_markdown(payload['data'], template=payload['template'],
+                               include_qr=payload['include_qr'], qr_filename=payload['qr_filename'])
+        return md.encode('utf-8')
+    from qr import render_qr
+    return render_qr(payload['url'], box_size=payload['box_size'], border=payload['border'], fmt=payload['format'])
+
+def run_batch(jobs):
+    results = []
+    for kind, payload in jobs:
+        try:
+            results.append((True, run_job(kind, payload)))
+        except Exception as e:
+            results.append((False, f'{type(e).__name__}: {e}'))
+    return results
+
+def parse_job(path, body):
+    try:
+        payload = json.loads(body or b'{}')
+    except ValueError:
+        raise BadRequest('body is not valid JSON')
+    if not isinstance(payload, dict):
+        raise BadRequest('body must be a JSON object')
+    if path == '/render':
+        data = payload.get('data')
+        if not isinstance(data, dict):
+            raise BadRequest('"data" must be a profile object')
+        template = payload.get('template', 'clean-minimal')
+        if template not in TEMPLATES:
+            raise BadRequest(f'unknown template {template!r}')
+        return 'render', {'data': data, 'template': template,
+                          'include_qr': bool(payload.get('include_qr')), 'qr_filename': payload.get('qr_filename')}
+    url = payload.get('url')
+    if not isinstance(url, str) or not url:
+        raise BadRequest('"url" is required')
+    try:
+        box_size = int(payload.get('box_size', 10))
+        border = int(payload.get('border', 2))
+    except (TypeError, ValueError):
+        raise BadRequest('box_size and border must be integers')
+    if not (1 <= box_size <= 40 and 0 <= border <= 20):
+        raise BadRequest('box_size must be 1-40 and border 0-20')
+    fmt = str(payload.get('format', 'png')).upper()
+    if fmt not in QR_FORMATS:
+        raise BadRequest('format must be png or svg')
+    return 'qr', {'url': url, 'box_size': box_size, 'border': border, 'format': fmt}
+
+# -------------------- Server --------------------
+class RenderService:
+    def __init__(self, workers=None, max_batch=32, batch_window=0.002, max_pending=1024, idle_timeout=30):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.max_pending = max_pending
+        self.idle_timeout = idle_timeout
+        self.metrics = Profiler(window=2000)
+        self.pending = 0
+        self.rejected = 0
+        self.batches = 0
+        self.batched_jobs = 0
+        self._queue = None
+        self._pool = None
+        self._batchers = []
+
+    async def start(self, host='127.0.0.1', port=8700):
+        self._queue = asyncio.Queue()
+        # forked workers would inherit accepted client sockets and keep them
+        # open after we close them, so Connection: close never reaches EOF
+        method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(method),
+                                         initializer=init_worker)
+        # one batcher per worker keeps every process busy with its own batch
+        self._batchers = [asyncio.create_task(self._batcher()) for _ in range(self.workers)]
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def close(self):
+        for task in self._batchers:
+            task.cancel()
+        await asyncio.gather(*self._batchers, return_exceptions=True)
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self._pool.shutdown(wait=True, cancel_futures=True))
+
+    async def submit(self, kind, payload):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            return None
+        self.pending += 1
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((kind, payload, future))
+        try:
+            return await future
+        finally:
+            self.pending -= 1
+
+    async def _batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            jobs = [(kind, payload) for kind, payload, _ in batch]
+            try:
+                results = await loop.run_in_executor(self._pool, run_batch, jobs)
+            except Exception as e:
+                results = [(False, f'{type(e).__name__}: {e}')] * len(batch)
+            self.batches += 1
+            self.batched_jobs += len(batch)
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(read_request(reader), self.idle_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                started = time.perf_counter()
+                status, ctype, payload, extra = await self._dispatch(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await write_response(writer, status, ctype, payload, keep_alive, extra)
+                endpoint = path.strip('/') if path in ENDPOINTS else 'other'
+                self.metrics.record(f'{endpoint}_{status}', time.perf_counter() - started)
+                if not keep_alive:
+                    break
+        except BadRequest as e:
+            await write_response(writer, e.status, 'text/plain', str(e).encode(), False)
+        except asyncio.CancelledError:
+            # server shutting down with this keep-alive connection idle
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, path, body):
+        if path == '/healthz':
+            return 200, 'text/plain', b'ok', None
+        if path == '/metrics':
+            text = self.metrics.to_prometheus('readme_service_seconds')
+            text += (f'readme_service_pending {self.pending}\n'
+                     f'readme_service_rejected_total {self.rejected}\n'
+                     f'readme_service_batches_total {self.batches}\n'
+                     f'readme_service_batched_jobs_total {self.batched_jobs}\n')
+            return 200, 'text/plain; version=0.0.4', text.encode(), None
+        if path not in ENDPOINTS:
+            return 404, 'text/plain', b'not found', None
+        if method != 'POST':
+            return 405, 'text/plain', b'use POST', None
+        try:
+            kind, payload = parse_job(path, body)
+        except BadRequest as e:
+            return 400, 'text/plain', str(e).encode(), None
+        result = await self.submit(kind, payload)
+        if result is None:
+            return 503, 'text/plain', b'busy, retry shortly', {'Retry-After': '1'}
+        ok, value = result
+        if not ok:
+            return 500, 'text/plain', value.encode(), None
+        if kind == 'render':
+            return 200, 'text/markdown; charset=utf-8', value, None
+        return 200, QR_FORMATS[payload['format']], value, None
+
+async def read_line(reader):
+    # StreamReader.readline() raises ValueError for a line over the stream
+    # limit (64 KiB), which would otherwise drop the connection unanswered
+    try:
+        return await reader.readline()
+    except ValueError:
+        raise HeaderTooLarge('request line or header too long')
+
+async def read_request(reader):
+    line = await read_line(reader)
+    if not line:
+        return None
+    try:
+        method, path, _ = line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise BadRequest('malformed request line')
+    headers = {}
+    while True:
+        line = await read_line(reader)
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = headers.get('content-length') or '0'
+    if not (length.isascii() and length.isdigit()):
+        raise BadRequest('invalid Content-Length')
+    length = int(length)
+    if length > MAX_BODY:
+        raise PayloadTooLarge('payload too large')
+    body = await reader.readexactly(length) if length else b''
+    return method.upper(), path.split('?', 1)[0], headers, body
+
+async def write_response(writer, status, ctype, payload, keep_alive, extra=None):
+    head = [f'HTTP/1.1 {status} {REASONS.get(status, "")}',
+            f'Content-Type: {ctype}',
+            f'Content-Length: {len(payload)}',
+            f'Connection: {"keep-alive" if keep_alive else "close"}']
+    for k, v in (extra or {}).items():
+        head.append(f'{k}: {v}')
+    writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + payload)
+    await writer.drain()
+
+async def serve(args):
+    service = RenderService(workers=args.workers, max_batch=args.max_batch,
+                            batch_window=args.batch_window / 1000, max_pending=args.max_pending)
+    server = await service.start(args.host, args.port)
+    print(f'render service on http://{args.host}:{args.port} ({service.workers} workers)', file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='HTTP service for README and QR rendering.')
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8700)
+    ap.add_argument('--workers', type=int, default=None, help='render processes (default: CPU count)')
+    ap.add_argument('--max-batch', type=int, default=32, help='jobs per micro-batch')
+    ap.add_argument('--batch-window', type=float, default=2.0, help='ms to wait while filling a batch')
+    ap.add_argument('--max-pending', type=int, default=1024, help='queued jobs before answering 503')
+    args = ap.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
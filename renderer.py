@@ -0,0 +1,393 @@
+# Pure README rendering - no Streamlit imports here, so batch jobs and
+# other services can import it directly.
+#
+# Each template is compiled once into a list of Section objects. A section
+# only reads a few fields of the profile and memoizes its output keyed by
+# those fields, so when one field changes (e.g. "About") only that section
+# re-renders and the rest of the document is spliced from cache. Project
+# lists are additionally memoized per project.
+#
+# Passing an AssetStore (local_assets.py) as `assets` swaps the shields.io
+# badges and github-readme-stats cards for local SVGs linked relatively.
+import io
+from functools import lru_cache
+from urllib.parse import quote_plus
+
+from caching import LRU
+
+TEMPLATES = ['clean-minimal', 'fancy-animated', 'resume-style']
+QR_FILENAME = 'portfolio-qr.png'
+QR_FORMATS = ('png', 'svg')
+
+def qr_file(fmt='png'):
+    return QR_FILENAME[:-len('png')] + fmt.lower()
+
+# profile fields and the defaults generate_markdown has always used
+FIELDS = {
+    'name': 'Your Name',
+    'title': '',
+    'about': '',
+    'socials': [],
+    'tech': [],
+    'education': '',
+    'cpi': '',
+    'certifications': [],
+    'projects': [],
+    'objective': '',
+    'phone': '',
+    'email': '',
+    'linkedin': '',
+    'github': '',
+    'github_stats': {},
+}
+
+@lru_cache(maxsize=4096)
+def badge_md(name):
+    safe = quote_plus(name)
+    return f"![{name}](https://img.shields.io/badge/{safe}-informational?style=for-the-badge&logo={safe}&logoColor=white)"
+
+def fingerprint(value):
+    # profile values are JSON-shaped, so repr() is an exact (and C-speed)
+    # fingerprint. Strings are repr'd (quoted) like everything else, which
+    # keeps None/'None', 5/'5' and ['a']/"['a']" apart, and unlike == it
+    # keeps 8/8.0/True apart too.
+    return repr(value)
+
+def snapshot(value):
+    # private copy of a JSON-shaped value, so later in-place edits to the
+    # caller's lists/dicts can't alias what a section last rendered
+    if isinstance(value, dict):
+        return {k: snapshot(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [snapshot(v) for v in value]
+    return value
+
+def has_numbers(value):
+    # == is only type-strict for JSON values without numbers/bools in them
+    # (8 == 8.0 == True), so snapshots that hold any are also fingerprinted
+    if isinstance(value, dict):
+        return any(map(has_numbers, value.values()))
+    if isinstance(value, list):
+        return any(map(has_numbers, value))
+    return isinstance(value, (int, float))
+
+def exact_key(value):
+    # what a snapshot must be compared with besides ==: None when == is exact
+    return fingerprint(value) if has_numbers(value) else None
+
+_MISSING = object()
+
+class Section:
+    # fn receives the listed fields positionally and returns a list of lines.
+    # The common case (nothing this section reads has changed since the last
+    # render) is a single == against a snapshot (plus a fingerprint compare
+    # when it holds numbers); otherwise the output is looked up by
+    # fingerprint before calling fn.
+    def __init__(self, name, fields, fn, maxsize=256):
+        self.name = name
+        self.fields = tuple(fields)
+        self.fn = fn
+        self.cache = LRU(maxsize)
+        self._last = None
+
+    def render(self, inputs):
+        values = [inputs[f] for f in self.fields]
+        last = self._last
+        if last is not None and last[0] == values and (last[2] is None or last[2] == fingerprint(values)):
+            return last[1]
+        key = tuple(fingerprint(v) for v in values)
+        chunk = self.cache.get(key, _MISSING)
+        if chunk is _MISSING:
+            lines = self.fn(*values)
+            chunk = "\n".join(lines) if lines else None
+            self.cache.put(key, chunk)
+        self._last = (snapshot(values), chunk, exact_key(values))
+        return chunk
+
+    def clear(self):
+        self.cache.clear()
+        self._last = None
+
+class ListSection(Section):
+    # header lines + one memoized chunk per item of a list field, so editing
+    # one project re-renders just that project. Items equal to the one at
+    # the same index last time (and, if it holds numbers, with the same
+    # fingerprint) reuse its chunk without a cache lookup.
+    def __init__(self, name, field, header, item_fn, maxsize=4096):
+        super().__init__(name, (field,), None, maxsize)
+        self.header = header
+        self.item_fn = item_fn
+
+    def render(self, inputs):
+        items = inputs[self.fields[0]]
+        last = self._last
+        if last is not None and last[0] == items and (last[3] is None or last[3] == fingerprint(items)):
+            return last[1]
+        prev_items, prev_chunks, prev_keys = (last[0], last[2], last[4]) if last is not None else ([], [], [])
+        items = items or []
+        snaps, item_chunks, exact_keys = [], [], []
+        for i, item in enumerate(items):
+            if (i < len(prev_items) and prev_items[i] == item
+                    and (prev_keys[i] is None or prev_keys[i] == fingerprint(item))):
+                snaps.append(prev_items[i])
+                item_chunks.append(prev_chunks[i])
+                exact_keys.append(prev_keys[i])
+                continue
+            key = fingerprint(item)
+            item_chunk = self.cache.get(key, _MISSING)
+            if item_chunk is _MISSING:
+                lines = self.item_fn(item)
+                item_chunk = "\n".join(lines) if lines else None
+                self.cache.put(key, item_chunk)
+            snaps.append(snapshot(item))
+            item_chunks.append(item_chunk)
+            exact_keys.append(exact_key(item))
+        chunk = None
+        if items:
+            chunk = "\n".join(self.header + [c for c in item_chunks if c is not None])
+        loose = any(k is not None for k in exact_keys) or not isinstance(inputs[self.fields[0]], list)
+        self._last = (snaps, chunk, item_chunks, fingerprint(inputs[self.fields[0]]) if loose else None, exact_keys)
+        return chunk
+
+class CompiledTemplate:
+    def __init__(self, name, sections):
+        self.name = name
+        self.sections = sections
+
+    def chunks(self, data, include_qr=False, qr_filename=None, assets=None):
+        inputs = {f: data.get(f, default) for f, default in FIELDS.items()}
+        inputs['include_qr'] = include_qr
+        inputs['qr_filename'] = qr_filename
+        inputs['assets'] = assets
+        for section in self.sections:
+            chunk = section.render(inputs)
+            if chunk is not None:
+                yield chunk
+
+    def clear(self):
+        for section in self.sections:
+            section.clear()
+
+# -------------------- Shared sections --------------------
+def _about(about):
+    return [about + "\n"] if about else []
+
+def _tech_badges(heading):
+    def fn(tech, assets):
+        if not tech:
+            return []
+        badge = assets.badge_md if assets is not None else badge_md
+        return [heading, " ".join([badge(t) for t in tech]) + "\n"]
+    return fn
+
+# -------------------- clean-minimal --------------------
+def _clean_header(name, title):
+    lines = [f"# {name}"]
+    if title: lines.append(f"**{title}**")
+    lines.append("\n---\n")
+    return lines
+
+def _clean_socials(socials):
+    if not socials:
+        return []
+    badges = []
+    for s in socials:
+        label = s.get('label','Link')
+        url = s.get('url','')
+        if url:
+            badges.append(f"[{label}]({url})")
+    return [" | ".join(badges) + "\n"] if badges else []
+
+def _clean_project(p):
+    lines = [f"### {p.get('name')}\n"]
+    if p.get("tags"): lines.append(f"*{p.get('tags')}*  \n")
+    if p.get("links"):
+        for l in p.get("links"):
+            if l.strip():
+                lines.append(f"[Repo / Link]({l})  \n")
+    if p.get("desc"): lines.append(p.get("desc") + "\n")
+    return lines
+
+def _clean_contact(email, phone, github):
+    lines = ["\n---\n", "Contact:  \n"]
+    if email: lines.append(f"- Email: {email}")
+    if phone: lines.append(f"- Phone: {phone}")
+    if github: lines.append(f"- GitHub: {github}")
+    return lines
+
+# -------------------- fancy-animated --------------------
+def _fancy_header(name, title):
+    lines = [f"# 👋 Hi, I'm **{name}**"]
+    if title: lines.append(f"### {title}")
+    lines.append("\n---\n")
+    return lines
+
+def _fancy_socials(socials):
+    social_badges = []
+    for s in socials:
+        label = s.get('label','Link').lower()
+        url = s.get('url','')
+        if url:
+            if 'instagram' in label:
+                social_badges.append(f"[![Instagram](https://img.shields.io/badge/Instagram-%23E4405F.svg?logo=Instagram&logoColor=white)]({url})")
+            elif 'linkedin' in label:
+                social_badges.append(f"[![LinkedIn](https://img.shields.io/badge/LinkedIn-%230077B5.svg?logo=linkedin&logoColor=white)]({url})")
+            elif 'email' in label:
+                social_badges.append(f"[![email](https://img.shields.io/badge/Email-D14836?logo=gmail&logoColor=white)](mailto:{url})")
+            else:
+                social_badges.append(f"[{s.get('label')}]({url})")
+    return [" ".join(social_badges) + "\n"] if social_badges else []
+
+def _fancy_highlights(github, github_stats, assets):
+    gh = (github or "").strip().rstrip("/").split("/")[-1] if github else ""
+    if not gh:
+        return []
+    if assets is not None and github_stats:
+        # the streak card needs the contribution calendar, which the REST
+        # import doesn't fetch, so only stats and languages are drawn locally
+        return [
+            "\n---\n\n## 📊 GitHub Highlights\n",
+            f"![]({assets.stats_card(github_stats)})\n",
+            f"![]({assets.langs_card(github_stats)})\n",
+        ]
+    return [
+        "\n---\n\n## 📊 GitHub Highlights\n",
+        f"![](https://github-readme-stats.vercel.app/api?username={gh}&show_icons=true&theme=radical&count_private=true)\n",
+        f"![](https://github-readme-stats.vercel.app/api/top-langs/?username={gh}&layout=compact&theme=radical)\n",
+        f"![](https://github-readme-streak-stats.herokuapp.com/?user={gh}&theme=radical)\n",
+    ]
+
+def _fancy_project(p):
+    lines = [f"### 🔹 {p.get('name')}  \n"]
+    if p.get("tags"): lines.append(f"**Category:** {p.get('tags')}  \n")
+    if p.get("links"):
+        for l in p.get("links"):
+            if l.strip():
+                lines.append(f"[Link]({l})  \n")
+    if p.get("desc"): lines.append(p.get("desc") + "  \n")
+    lines.append("\n")
+    return lines
+
+def _fancy_qr(include_qr, qr_filename):
+    if include_qr and qr_filename:
+        return ["\n---\n", f"## 🔗 Portfolio QR  \n![]({qr_filename})  \n"]
+    return []
+
+def _fancy_contact(email, linkedin, github):
+    lines = ["\n---\n", "Contact & Links  \n"]
+    if email: lines.append(f"- Email: {email}  ")
+    if linkedin: lines.append(f"- LinkedIn: {linkedin}  ")
+    if github: lines.append(f"- GitHub: {github}  ")
+    return lines
+
+# -------------------- resume-style --------------------
+def _resume_header(name, title):
+    return [f"# {name} \n**{title}**\n", "---\n"]
+
+def _resume_about(about):
+    return [f"**Profile:** {about}\n"] if about else []
+
+def _resume_skills(tech):
+    return ["\n**Skills:**\n", ", ".join(tech) + "\n"] if tech else []
+
+def _resume_education(education, cpi):
+    return ["\n**Education:**\n", f"- {education} (CPI: {cpi})\n"] if education else []
+
+def _resume_certs(certs):
+    if not certs:
+        return []
+    return ["\n**Certifications:**\n"] + [f"- {c}\n" for c in certs]
+
+def _resume_project(p):
+    links_str = ", ".join([l for l in p.get('links',[]) if l.strip()])
+    return [f"- **{p.get('name')}** — {p.get('desc')} ({links_str})\n"]
+
+def _resume_contact(email, phone, linkedin, github):
+    lines = ["\n**Contact:**\n"]
+    if email: lines.append(f"- Email: {email}\n")
+    if phone: lines.append(f"- Phone: {phone}\n")
+    if linkedin: lines.append(f"- LinkedIn: {linkedin}\n")
+    if github: lines.append(f"- GitHub: {github}\n")
+    return lines
+
+# -------------------- Compilation --------------------
+def compile_template(template):
+    if template == "clean-minimal":
+        return CompiledTemplate(template, [
+            Section('header', ('name', 'title'), _clean_header),
+            Section('about', ('about',), _about),
+            Section('socials', ('socials',), _clean_socials),
+            Section('tech', ('tech', 'assets'), _tech_badges("\n**Tech:**\n")),
+            ListSection('projects', 'projects', ["\n---\n\n## Projects\n"], _clean_project),
+            Section('contact', ('email', 'phone', 'github'), _clean_contact),
+        ])
+    if template == "fancy-animated":
+        return CompiledTemplate(template, [
+            Section('header', ('name', 'title'), _fancy_header),
+            Section('about', ('about',), _about),
+            Section('socials', ('socials',), _fancy_socials),
+            Section('highlights', ('github', 'github_stats', 'assets'), _fancy_highlights),
+            Section('tech', ('tech', 'assets'), _tech_badges("\n---\n\n# 💻 Tech Stack\n")),
+            ListSection('projects', 'projects', ["\n---\n\n# 🚀 Selected Projects\n"], _fancy_project),
+            Section('qr', ('include_qr', 'qr_filename'), _fancy_qr),
+            Section('contact', ('email', 'linkedin', 'github'), _fancy_contact),
+        ])
+    if template == "resume-style":
+        return CompiledTemplate(template, [
+            Section('header', ('name', 'title'), _resume_header),
+            Section('about', ('about',), _resume_about),
+            Section('skills', ('tech',), _resume_skills),
+            Section('education', ('education', 'cpi'), _resume_education),
+            Section('certifications', ('certifications',), _resume_certs),
+            ListSection('projects', 'projects', ["\n**Projects:**\n"], _resume_project),
+            Section('contact', ('email', 'phone', 'linkedin', 'github'), _resume_contact),
+        ])
+    return CompiledTemplate(template, [])
+
+COMPILED = {t: compile_template(t) for t in TEMPLATES}
+
+def get_template(template):
+    compiled = COMPILED.get(template)
+    if compiled is None:
+        compiled = compile_template(template)
+    return compiled
+
+def clear_caches():
+    for compiled in COMPILED.values():
+        compiled.clear()
+    badge_md.cache_clear()
+
+# -------------------- Output --------------------
+def iter_markdown(data, template="clean-minimal", include_qr=False, qr_filename=None, assets=None):
+    # the document as a stream of section chunks and "\n" separators, so
+    # large documents never have to exist as one string
+    first = True
+    for chunk in get_template(template).chunks(data, include_qr, qr_filename, assets):
+        if not first:
+            yield "\n"
+        yield chunk
+        first = False
+
+def _is_binary(sink):
+    if isinstance(sink, io.TextIOBase):
+        return False
+    if isinstance(sink, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return 'b' in getattr(sink, 'mode', '')
+
+def write_markdown(sink, data, template="clean-minimal", include_qr=False, qr_filename=None, encoding='utf-8',
+                   assets=None):
+    # write to any file-like sink (text or binary: files, sockets' makefile(),
+    # zip entries, HTTP response bodies); returns characters/bytes written
+    binary = _is_binary(sink)
+    written = 0
+    for piece in iter_markdown(data, template, include_qr, qr_filename, assets):
+        if binary:
+            piece = piece.encode(encoding)
+        sink.write(piece)
+        written += len(piece)
+    return written
+
+def generate_markdown(data, template="clean-minimal", include_qr=False, qr_filename=None, assets=None):
+    # same chunks as iter_markdown(), joined in one go
+    return "\n".join(get_template(template).chunks(data, include_qr, qr_filename, assets))
@@ -0,0 +1,140 @@
+# generate_markdown as it was before renderer.py compiled templates into
+# memoized sections, kept verbatim as the reference output for tests.
+from urllib.parse import quote_plus
+
+def badge_md(name):
+    safe = quote_plus(name)
+    return f"![{name}](https://img.shields.io/badge/{safe}-informational?style=for-the-badge&logo={safe}&logoColor=white)"
+
+def generate_markdown(data, template="clean-minimal", include_qr=False, qr_filename=None):
+    lines = []
+    name = data.get("name","Your Name")
+    title = data.get("title","")
+    about = data.get("about","")
+    socials = data.get("socials",[])
+    tech = data.get("tech",[])
+    education = data.get("education","")
+    cpi = data.get("cpi","")
+    certs = data.get("certifications",[])
+    projects = data.get("projects",[])
+    objective = data.get("objective","")
+    phone = data.get("phone","")
+    email = data.get("email","")
+    linkedin = data.get("linkedin","")
+    github = data.get("github","")
+
+    if template == "clean-minimal":
+        lines.append(f"# {name}")
+        if title: lines.append(f"**{title}**")
+        lines.append("\n---\n")
+        if about: lines.append(about + "\n")
+        if socials:
+            badges = []
+            for s in socials:
+                label = s.get('label','Link')
+                url = s.get('url','')
+                if url:
+                    badges.append(f"[{label}]({url})")
+            if badges:
+                lines.append(" | ".join(badges) + "\n")
+        if tech:
+            lines.append("\n**Tech:**\n")
+            lines.append(" ".join([badge_md(t) for t in tech]) + "\n")
+        if projects:
+            lines.append("\n---\n\n## Projects\n")
+            for p in projects:
+                lines.append(f"### {p.get('name')}\n")
+                if p.get("tags"): lines.append(f"*{p.get('tags')}*  \n")
+                if p.get("links"):
+                    for l in p.get("links"):
+                        if l.strip():
+                            lines.append(f"[Repo / Link]({l})  \n")
+                if p.get("desc"): lines.append(p.get("desc") + "\n")
+        lines.append("\n---\n")
+        lines.append("Contact:  \n")
+        if email: lines.append(f"- Email: {email}")
+        if phone: lines.append(f"- Phone: {phone}")
+        if github: lines.append(f"- GitHub: {github}")
+        return "\n".join(lines)
+
+    if template == "fancy-animated":
+        lines.append(f"# 👋 Hi, I'm **{name}**")
+        if title: lines.append(f"### {title}")
+        lines.append("\n---\n")
+        if about: lines.append(about + "\n")
+        # social badges
+        social_badges = []
+        for s in socials:
+            label = s.get('label','Link').lower()
+            url = s.get('url','')
+            if url:
+                if 'instagram' in label:
+                    social_badges.append(f"[![Instagram](https://img.shields.io/badge/Instagram-%23E4405F.svg?logo=Instagram&logoColor=white)]({url})")
+                elif 'linkedin' in label:
+                    social_badges.append(f"[![LinkedIn](https://img.shields.io/badge/LinkedIn-%230077B5.svg?logo=linkedin&logoColor=white)]({url})")
+                elif 'email' in label:
+                    social_badges.append(f"[![email](https://img.shields.io/badge/Email-D14836?logo=gmail&logoColor=white)](mailto:{url})")
+                else:
+                    social_badges.append(f"[{s.get('label')}]({url})")
+        if social_badges:
+            lines.append(" ".join(social_badges) + "\n")
+
+        gh = (github or "").strip().rstrip("/").split("/")[-1] if github else ""
+        if gh:
+            lines.append("\n---\n\n## 📊 GitHub Highlights\n")
+            lines.append(f"![](https://github-readme-stats.vercel.app/api?username={gh}&show_icons=true&theme=radical&count_private=true)\n")
+            lines.append(f"![](https://github-readme-stats.vercel.app/api/top-langs/?username={gh}&layout=compact&theme=radical)\n")
+            lines.append(f"![](https://github-readme-streak-stats.herokuapp.com/?user={gh}&theme=radical)\n")
+
+        if tech:
+            lines.append("\n---\n\n# 💻 Tech Stack\n")
+            lines.append(" ".join([badge_md(t) for t in tech]) + "\n")
+
+        if projects:
+            lines.append("\n---\n\n# 🚀 Selected Projects\n")
+            for p in projects:
+                lines.append(f"### 🔹 {p.get('name')}  \n")
+                if p.get("tags"): lines.append(f"**Category:** {p.get('tags')}  \n")
+                if p.get("links"):
+                    for l in p.get("links"):
+                        if l.strip():
+                            lines.append(f"[Link]({l})  \n")
+                if p.get("desc"): lines.append(p.get("desc") + "  \n")
+                lines.append("\n")
+        if include_qr and qr_filename:
+            lines.append("\n---\n")
+            lines.append(f"## 🔗 Portfolio QR  \n![]({qr_filename})  \n")
+        lines.append("\n---\n")
+        lines.append("Contact & Links  \n")
+        if email: lines.append(f"- Email: {email}  ")
+        if linkedin: lines.append(f"- LinkedIn: {linkedin}  ")
+        if github: lines.append(f"- GitHub: {github}  ")
+        return "\n".join(lines)
+
+    if template == "resume-style":
+        lines.append(f"# {name} \n**{title}**\n")
+        lines.append("---\n")
+        if about: lines.append(f"**Profile:** {about}\n")
+        if tech:
+            lines.append("\n**Skills:**\n")
+            lines.append(", ".join(tech) + "\n")
+        if education:
+            lines.append("\n**Education:**\n")
+            lines.append(f"- {education} (CPI: {cpi})\n")
+        if certs:
+            lines.append("\n**Certifications:**\n")
+            for c in certs:
+                lines.append(f"- {c}\n")
+        if projects:
+            lines.append("\n**Projects:**\n")
+            for p in projects:
+                links_str = ", ".join([l for l in p.get('links',[]) if l.strip()])
+                lines.append(f"- **{p.get('name')}** — {p.get('desc')} ({links_str})\n")
+        lines.append("\n**Contact:**\n")
+        if email: lines.append(f"- Email: {email}\n")
+        if phone: lines.append(f"- Phone: {phone}\n")
+        if linkedin: lines.append(f"- LinkedIn: {linkedin}\n")
+        if github: lines.append(f"- GitHub: {github}\n")
+        return "\n".join(lines)
+
+    return "\n".join(lines)
@@ -0,0 +1,36 @@
+import io
+import os
+
+import pytest
+
+from batch_render import render_one, run_batch
+
+def test_failed_render_keeps_previous_readme(tmp_path):
+    readme = tmp_path / 'a' / 'README.md'
+    readme.parent.mkdir()
+    readme.write_text('GOOD OLD README', encoding='utf-8')
+    broken = {'name': 'A', 'about': 'hello', 'projects': [{'name': 'p', 'links': [None]}]}
+    with pytest.raises(AttributeError):
+        render_one(('a', broken, 'clean-minimal', str(tmp_path), False, 'png', False))
+    assert readme.read_text(encoding='utf-8') == 'GOOD OLD README'
+    assert os.listdir(readme.parent) == ['README.md']
+
+    render_one(('a', {'name': 'A'}, 'clean-minimal', str(tmp_path), False, 'png', False))
+    assert readme.read_text(encoding='utf-8').startswith('# A')
+
+def test_run_batch_reports_failed_profiles_and_bad_lines(tmp_path):
+    src = tmp_path / 'profiles.jsonl'
+    src.write_text('{"id": "ada", "name": "Ada"}\n'
+                   '{oops\n'
+                   '[1]\n'
+                   '\n'
+                   '{"id": "broken", "projects": [{"name": "p", "links": [null]}]}\n'
+                   '{"name": "Grace", "github": 5}\n', encoding='utf-8')
+    log = io.StringIO()
+    stats = run_batch(str(src), str(tmp_path / 'out'), workers=2, log=log)
+    assert (stats['rendered'], stats['failed']) == (2, 3)
+    lines = log.getvalue().splitlines()
+    assert lines[0].startswith(f'{src}:2: invalid JSON')
+    assert lines[1] == f'{src}:3: expected an object, got list'
+    assert any(line.startswith('broken: render failed: ') for line in lines)
+    assert sorted(os.listdir(tmp_path / 'out')) == ['Grace', 'ada', 'broken']
@@ -0,0 +1,109 @@
+import json
+import re
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+import github_import
+from conftest import StubHandler
+from github_import import GitHubImporter, GitHubImportError
+
+REPOS = 250
+# repo i's /languages: everything has Python, every third repo some Go
+LANGUAGES = {i: dict({'Python': 100}, **({'Go': 1000} if i % 3 == 0 else {})) for i in range(REPOS)}
+
+def make_handler(calls, rate_limited=None, fail=None):
+    # rate_limited: {path: [headers for each 403 sent before answering]};
+    # requests whose path matches the regex `fail` get a 502
+    lock = threading.Lock()
+
+    class Handler(StubHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            base = f'http://127.0.0.1:{self.server.server_port}'
+            with lock:
+                calls.append(self.path)
+                limited = (rate_limited or {}).get(url.path)
+                headers = limited.pop(0) if limited else None
+            if headers is not None:
+                return self.send(403, b'{"message": "API rate limit exceeded"}', headers)
+            if fail and re.search(fail, self.path):
+                return self.send(502, b'{"message": "Bad Gateway"}')
+            if url.path == '/users/octo':
+                return self.reply({'login': 'octo', 'name': 'Octo', 'bio': 'bio',
+                                   'html_url': 'https://github.com/octo', 'public_repos': REPOS})
+            if url.path == '/users/octo/repos':
+                per_page, page = int(query['per_page'][0]), int(query.get('page', ['1'])[0])
+                last = -(-REPOS // per_page)
+                repos = [{'name': f'r{i}', 'full_name': f'octo/r{i}', 'html_url': f'https://github.com/octo/r{i}',
+                          'language': 'Python', 'stargazers_count': i, 'pushed_at': f'2024-01-01T00:00:{i % 60:02d}Z',
+                          'languages_url': f'{base}/repos/octo/r{i}/languages'}
+                         for i in range((page - 1) * per_page, min(page * per_page, REPOS))]
+                return self.reply(repos, {'Link': f'<{base}/users/octo/repos?per_page={per_page}&page={last}>; '
+                                                  f'rel="last"'})
+            m = re.fullmatch(r'/repos/octo/r(\d+)/languages', url.path)
+            if m:
+                return self.reply(LANGUAGES[int(m.group(1))])
+            self.send(404, b'{"message": "Not Found"}')
+
+        def reply(self, body, headers=None):
+            self.send(200, json.dumps(body).encode('utf-8'), headers)
+
+    return Handler
+
+def test_pagination_and_languages(serve):
+    calls = []
+    importer = GitHubImporter(api_url=serve(make_handler(calls)), workers=8)
+    profile = importer.import_profile('octo', rank_by='stars', max_projects=3)
+
+    pages = sorted(parse_qs(urlsplit(c).query).get('page', ['1'])[0] for c in calls if '/repos?' in c)
+    assert pages == ['1', '2', '3']
+    assert sum('/languages' in c for c in calls) == REPOS
+    assert [p['name'] for p in profile['projects']] == ['r249', 'r248', 'r247']
+
+    go = sum(langs.get('Go', 0) for langs in LANGUAGES.values())
+    assert profile['tech'] == ['Go', 'Python']
+    assert profile['github_stats']['languages'] == {'Go': go, 'Python': 100 * REPOS}
+    assert profile['github_stats']['stars'] == sum(range(REPOS))
+
+def test_rate_limit_backoff(serve, monkeypatch):
+    slept = []
+    monkeypatch.setattr(github_import.time, 'sleep', slept.append)
+    reset = str(int(time.time()) + 30)
+    calls = []
+    base = serve(make_handler(calls, rate_limited={'/users/octo': [
+        {'Retry-After': '2'},
+        {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset},
+    ]}))
+    profile = GitHubImporter(api_url=base, max_wait=60).import_profile('octo', languages=False)
+    assert profile['name'] == 'Octo'
+    assert calls.count('/users/octo') == 3
+    assert slept[0] == 2.0
+    assert 29 <= slept[1] <= 32
+
+def test_rate_limit_gives_up_after_max_wait(serve, monkeypatch):
+    monkeypatch.setattr(github_import.time, 'sleep', lambda seconds: None)
+    reset = str(int(time.time()) + 3600)
+    base = serve(make_handler([], rate_limited={'/users/octo': [
+        {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset}]}))
+    with pytest.raises(GitHubImportError, match='rate limit'):
+        GitHubImporter(api_url=base, max_wait=60).import_profile('octo', languages=False)
+
+@pytest.mark.parametrize('fail, message', [
+    (r'/repos\?.*page=3', 'repos page 3 of octo failed'),
+    (r'/repos\?', 'repos of octo failed'),
+])
+def test_failed_repos_page_raises(serve, fail, message):
+    base = serve(make_handler([], fail=fail))
+    with pytest.raises(GitHubImportError, match=message):
+        GitHubImporter(api_url=base).import_profile('octo', languages=False)
+
+def test_unknown_user_and_username_encoding(serve):
+    calls = []
+    base = serve(make_handler(calls))
+    with pytest.raises(GitHubImportError, match='check username'):
+        GitHubImporter(api_url=base).import_profile('no/body?x', languages=False)
+    assert sorted(c.split('?')[0] for c in calls) == ['/users/no%2Fbody%3Fx', '/users/no%2Fbody%3Fx/repos']
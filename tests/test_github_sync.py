@@ -0,0 +1,124 @@
+import hashlib
+import io
+import json
+import re
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from conftest import StubHandler
+from github_sync import GitHubSync, SnapshotStore
+
+REPOS = 120  # two pages of 100
+
+class FakeGitHub:
+    # one user with REPOS repos; answers If-None-Match with 304, and paths
+    # matching `fail` with 502
+    def __init__(self):
+        self.calls = []
+        self.bio = 'bio'
+        self.pushed = {i: '2024-01-01T00:00:00Z' for i in range(REPOS)}
+        self.fail = None
+        self.lock = threading.Lock()
+
+    def handler(self):
+        gh = self
+
+        class Handler(StubHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                query = parse_qs(url.query)
+                base = f'http://127.0.0.1:{self.server.server_port}'
+                with gh.lock:
+                    gh.calls.append(self.path)
+                if gh.fail and re.search(gh.fail, self.path):
+                    return self.send(502, b'{}')
+                if url.path == '/users/octo':
+                    return self.reply({'login': 'octo', 'name': 'Octo', 'bio': gh.bio,
+                                       'html_url': 'https://github.com/octo'})
+                if url.path == '/users/octo/repos':
+                    per_page, page = int(query['per_page'][0]), int(query.get('page', ['1'])[0])
+                    repos = [{'name': f'r{i}', 'full_name': f'octo/r{i}', 'html_url': f'https://github.com/octo/r{i}',
+                              'language': 'Python', 'pushed_at': gh.pushed[i],
+                              'languages_url': f'{base}/repos/octo/r{i}/languages'}
+                             for i in range((page - 1) * per_page, min(page * per_page, REPOS))]
+                    last = -(-REPOS // per_page)
+                    return self.reply(repos, {'Link': f'<{base}/users/octo/repos?per_page={per_page}&page={last}>; '
+                                                      f'rel="last"'})
+                m = re.fullmatch(r'/repos/octo/r(\d+)/languages', url.path)
+                if m:
+                    i = int(m.group(1))
+                    return self.reply({'Python': 100, 'Go': 10 * i + (1000 if gh.pushed[i] > '2024' else 0)})
+                self.send(404, b'{}')
+
+            def reply(self, body, headers=None):
+                data = json.dumps(body).encode('utf-8')
+                etag = '"' + hashlib.sha256(data).hexdigest()[:16] + '"'
+                headers = dict(headers or {}, ETag=etag)
+                if self.headers.get('If-None-Match') == etag:
+                    return self.send(304, b'', headers)
+                self.send(200, data, headers)
+
+        return Handler
+
+@pytest.fixture
+def github(serve):
+    gh = FakeGitHub()
+    gh.url = serve(gh.handler())
+    return gh
+
+def sync(github, tmp_path, **kwargs):
+    log = io.StringIO()
+    runner = GitHubSync(SnapshotStore(str(tmp_path / 'store')), api_url=github.url, workers=4)
+    stats = runner.run([{'username': 'octo', 'template': 'clean-minimal'}], str(tmp_path / 'out'), log=log, **kwargs)
+    return stats, log.getvalue()
+
+def outputs(tmp_path):
+    return ((tmp_path / 'store' / 'octo.json').read_text(encoding='utf-8'),
+            (tmp_path / 'out' / 'octo' / 'README.md').read_text(encoding='utf-8'))
+
+def test_unchanged_account_is_all_304s(github, tmp_path):
+    stats, _ = sync(github, tmp_path)
+    assert (stats['rendered'], stats['failed'], stats['not_modified']) == (1, 0, 0)
+    assert stats['requests'] == 1 + 2 + REPOS
+    readme = outputs(tmp_path)[1]
+    assert '### r0' in readme
+
+    github.calls.clear()
+    stats, _ = sync(github, tmp_path)
+    assert (stats['rendered'], stats['unchanged'], stats['failed']) == (0, 1, 0)
+    # user + two repo pages, all 304; languages not asked for at all
+    assert stats['requests'] == stats['not_modified'] == 3
+    assert stats['languages_skipped'] == REPOS
+    assert not any('/languages' in c for c in github.calls)
+    assert outputs(tmp_path)[1] == readme
+
+def test_only_pushed_repos_refetch_languages(github, tmp_path):
+    sync(github, tmp_path)
+    github.calls.clear()
+    github.pushed[7] = '2025-01-01T00:00:00Z'
+    stats, _ = sync(github, tmp_path)
+    assert [c for c in github.calls if '/languages' in c] == ['/repos/octo/r7/languages']
+    assert (stats['rendered'], stats['languages_skipped']) == (1, REPOS - 1)
+    snapshot = json.loads(outputs(tmp_path)[0])
+    assert snapshot['languages']['octo/r7']['data']['Go'] == 1070
+
+def test_profile_change_rerenders(github, tmp_path):
+    sync(github, tmp_path)
+    github.bio = 'new bio'
+    stats, _ = sync(github, tmp_path)
+    assert stats['rendered'] == 1
+    assert 'new bio' in outputs(tmp_path)[1]
+
+@pytest.mark.parametrize('fail', [r'/repos/octo/r3/languages', r'/users/octo/repos\?.*page=2', r'/users/octo/repos'])
+def test_failed_request_keeps_previous_snapshot_and_readme(github, tmp_path, fail):
+    sync(github, tmp_path)
+    before = outputs(tmp_path)
+    github.pushed = {i: '2025-01-01T00:00:00Z' for i in range(REPOS)}  # every repo needs /languages again
+    github.bio = 'new bio'
+    github.fail = fail
+    stats, log = sync(github, tmp_path)
+    assert (stats['failed'], stats['rendered']) == (1, 0)
+    assert 'sync failed for octo' in log and 'HTTP 502' in log
+    assert outputs(tmp_path) == before
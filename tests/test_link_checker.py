@@ -0,0 +1,85 @@
+import threading
+import time
+
+from conftest import StubHandler
+from link_checker import LinkChecker, checkable, collect_urls
+
+def make_handler(calls, delay=0.0, active=None):
+    # records (method, path) per request; active tracks the peak number of
+    # requests being served at once
+    lock = threading.Lock()
+
+    class Handler(StubHandler):
+        def reply(self):
+            with lock:
+                calls.append((self.command, self.path))
+                if active is not None:
+                    active['now'] += 1
+                    active['peak'] = max(active['peak'], active['now'])
+            time.sleep(delay)
+            if active is not None:
+                with lock:
+                    active['now'] -= 1
+            if self.path.startswith('/nohead') and self.command == 'HEAD':
+                return self.send(405)
+            if self.path.startswith('/dead'):
+                return self.send(404)
+            if self.path.startswith('/bot'):
+                return self.send(999)
+            self.send(200, b'ok', content_type='text/plain')
+
+        do_HEAD = do_GET = reply
+
+    return Handler
+
+def test_head_then_get_fallback(serve):
+    calls = []
+    base = serve(make_handler(calls))
+    checker = LinkChecker(workers=2)
+    ok = checker.check(f'{base}/page')
+    assert (ok['state'], ok['method'], ok['status']) == ('ok', 'HEAD', 200)
+    refused = checker.check(f'{base}/nohead')
+    assert (refused['state'], refused['method'], refused['status']) == ('ok', 'GET', 200)
+    dead = checker.check(f'{base}/dead')
+    assert (dead['state'], dead['method'], dead['status']) == ('broken', 'GET', 404)
+    assert checker.check(f'{base}/bot')['state'] == 'unverified'
+    assert calls == [('HEAD', '/page'), ('HEAD', '/nohead'), ('GET', '/nohead'), ('HEAD', '/dead'),
+                     ('GET', '/dead'), ('HEAD', '/bot')]
+
+def test_per_host_limit(serve):
+    calls, active = [], {'now': 0, 'peak': 0}
+    base = serve(make_handler(calls, delay=0.05, active=active))
+    checker = LinkChecker(workers=12, per_host=3)
+    results = checker.check_many(f'{base}/p{i}' for i in range(12))
+    assert len(results) == 12 and all(r['state'] == 'ok' for r in results.values())
+    assert len(calls) == 12
+    assert 1 < active['peak'] <= 3
+
+def test_ttl_cache(serve):
+    calls = []
+    base = serve(make_handler(calls))
+    checker = LinkChecker(workers=2)
+    urls = [f'{base}/a', f'{base}/a', f'{base}/b']
+    checker.check_many(urls)
+    checker.check_many(urls)
+    assert sorted(calls) == [('HEAD', '/a'), ('HEAD', '/b')]
+
+    expired = LinkChecker(workers=2, ttl=0)
+    expired.check(f'{base}/a')
+    expired.check(f'{base}/a')
+    assert len(calls) == 4
+
+def test_malformed_url_is_broken():
+    profile = {'projects': [{'name': 'x', 'links': ['http://[oops/x', 'ftp://example.com', 'http://']}]}
+    assert checkable('http://[oops/x')
+    assert not checkable('ftp://example.com')
+    report = LinkChecker(workers=2).check_profile(profile)
+    assert [(where, r['state']) for where, _, r in report] == [('projects[0].links[0]', 'broken'),
+                                                               ('projects[0].links[2]', 'broken')]
+    assert 'InvalidURL' in report[0][2]['error']
+
+def test_collect_urls_skips_non_text_values():
+    profile = {'github': 5, 'socials': [{'label': 'x', 'url': ['a']}, 'oops'],
+               'projects': [{'links': 'https://a.example'}, {'links': [None, ' https://b.example ']}]}
+    urls = [(where, url) for where, url in collect_urls(profile) if url]
+    assert urls == [('projects[1].links[1]', 'https://b.example')]
@@ -0,0 +1,54 @@
+import json
+import threading
+import time
+
+from conftest import StubHandler
+from lottie_assets import LottieLoader, load_bundled
+
+ANIMATION = {'v': '5.7.4', 'fr': 30, 'ip': 0, 'op': 60, 'w': 10, 'h': 10, 'layers': []}
+
+def make_handler(calls, delay=0.0, status=200):
+    lock = threading.Lock()
+
+    class Handler(StubHandler):
+        def do_GET(self):
+            with lock:
+                calls.append(self.path)
+            time.sleep(delay)
+            self.send(status, json.dumps(ANIMATION).encode('utf-8') if status == 200 else b'{}')
+
+    return Handler
+
+def test_get_does_not_wait_for_the_network(serve, tmp_path):
+    calls = []
+    url = serve(make_handler(calls, delay=0.5)) + '/header.json'
+    loader = LottieLoader(disk_dir=str(tmp_path))
+
+    start = time.perf_counter()
+    first = loader.get(url, name='header')
+    assert time.perf_counter() - start < 0.05
+    assert first == load_bundled('header')
+
+    loader.wait(timeout=5)
+    assert calls == ['/header.json']
+    start = time.perf_counter()
+    assert loader.get(url, name='header') == ANIMATION
+    assert time.perf_counter() - start < 0.05
+
+    # a fresh loader (a new process) starts from the disk cache
+    assert LottieLoader(disk_dir=str(tmp_path)).get(url) == ANIMATION
+    assert calls == ['/header.json']
+
+def test_failed_fetch_backs_off(serve):
+    calls = []
+    url = serve(make_handler(calls, status=503)) + '/projects.json'
+    loader = LottieLoader(retry_after=60)
+    for _ in range(5):
+        assert loader.get(url, name='projects') == load_bundled('projects')
+        loader.wait(timeout=5)
+    assert calls == ['/projects.json']
+
+    loader.retry_after = 0
+    loader.get(url)
+    loader.wait(timeout=5)
+    assert len(calls) == 2
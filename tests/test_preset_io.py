@@ -0,0 +1,52 @@
+import io
+import json
+
+import pytest
+
+from preset_io import export_jsonl, import_jsonl
+from preset_store import PresetStore
+
+LINES = [
+    {'name': 'Ada', 'github': 'https://github.com/ada'},
+    {'self': 1, 'name': 'Self'},
+    {'github': 5},
+    {'id': {'x': 1}, 'name': 'Bad id'},
+    {'id': 'grace', 'name': 'Grace', 'cpi': 9.5},
+]
+
+def jsonl(lines, extra=b''):
+    return io.BytesIO(b''.join(json.dumps(line).encode('utf-8') + b'\n' for line in lines) + extra)
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_bad_lines_are_reported_and_skipped(tmp_path, workers):
+    store = PresetStore(str(tmp_path / 'presets.db'))
+    errors = []
+    nested = b'[' * 100000 + b']' * 100000 + b'\n'
+    stats = import_jsonl(jsonl(LINES, b'{oops\n[1]\n' + nested), store, workers=workers, chunk_lines=2,
+                         on_error=lambda lineno, message: errors.append((lineno, message)))
+    assert (stats['imported'], stats['failed']) == (3, 5)
+    assert [lineno for lineno, _ in errors] == [3, 4, 6, 7, 8]
+    assert errors[0] == (3, 'github: expected text, got int')
+    assert sorted(name for name, _ in store.items()) == ['Self', 'ada', 'grace']
+    assert store.get('Self')['self'] == 1
+    assert store.get('grace')['cpi'] == '9.5'
+
+def test_export_round_trip(tmp_path):
+    store = PresetStore(str(tmp_path / 'a.db'))
+    import_jsonl(jsonl(LINES), store, workers=0)
+    out = io.BytesIO()
+    assert export_jsonl(store, out) == 3
+    copy = PresetStore(str(tmp_path / 'b.db'))
+    out.seek(0)
+    assert import_jsonl(out, copy, workers=0)['imported'] == 3
+    assert dict(copy.items()) == dict(store.items())
+
+def test_resume_continues_after_last_chunk(tmp_path):
+    store = PresetStore(str(tmp_path / 'presets.db'))
+    lines = [{'id': f'p{i}', 'name': f'P{i}'} for i in range(10)]
+    data = jsonl(lines).getvalue()
+    cut = data.index(b'{"id": "p6"')  # a crash after the first three 2-line chunks
+    import_jsonl(io.BytesIO(data[:cut]), store, workers=0, chunk_lines=2, checkpoint='import:test')
+    stats = import_jsonl(io.BytesIO(data), store, workers=0, chunk_lines=2, checkpoint='import:test', resume=True)
+    assert stats['resumed_from'] == 7
+    assert stats['imported'] == 10 and len(list(store.items())) == 10
@@ -0,0 +1,32 @@
+import pickle
+
+import pytest
+
+from profile_model import Profile, ProfileError
+
+def test_self_key_is_kept_as_extra():
+    profile = Profile.from_dict({'name': 'Ada', 'self': 1})
+    assert profile.extra == {'self': 1}
+    assert profile.replace(self=2).to_dict()['self'] == 2
+
+def test_invalid_fields_raise_profile_error():
+    with pytest.raises(ProfileError) as e:
+        Profile.from_dict({'github': 5, 'projects': [{'name': 'p', 'links': 'a b'}, 3]})
+    assert [where for where, _ in e.value.errors] == ['github', 'projects[1]']
+    with pytest.raises(ProfileError):
+        Profile.from_dict(['not', 'an', 'object'])
+
+def test_eq_agrees_with_hash():
+    a = Profile(name='Ada', x=1)
+    b = Profile(name='Ada', x=1.0)
+    assert a != b and len({a, b}) == 2
+    c = Profile.from_dict(a.to_dict())
+    assert a == c and hash(a) == hash(c) and len({a, c}) == 1
+    assert pickle.loads(pickle.dumps(a)) == a
+
+def test_form_text_and_lists_match_json_lists():
+    form = Profile(tech='Python, Go ,', certifications='AWS\n\nCKA\n',
+                   projects=[{'name': 'p', 'links': 'https://a https://b', 'tags': ['x', 'y'], 'desc': ''}])
+    lists = Profile(tech=['Python', 'Go'], certifications=['AWS', 'CKA'],
+                    projects=[{'name': 'p', 'links': ['https://a', 'https://b'], 'tags': 'x, y', 'desc': ''}])
+    assert form == lists and form.digest == lists.digest
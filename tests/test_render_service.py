@@ -0,0 +1,45 @@
+import asyncio
+import json
+
+from render_service import RenderService
+
+async def exchange(requests):
+    # [(status line, body)] for raw requests, each on its own connection
+    service = RenderService(workers=1)
+    server = await service.start('127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    replies = []
+    try:
+        for raw in requests:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(raw)
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), 30)
+            writer.close()
+            head, _, body = data.partition(b'\r\n\r\n')
+            replies.append((head.split(b'\r\n')[0].decode(), body))
+    finally:
+        server.close()
+        await service.close()
+    return replies
+
+def post(path, body, headers=b''):
+    return (b'POST ' + path + b' HTTP/1.1\r\nConnection: close\r\n' + headers +
+            b'Content-Length: %d\r\n\r\n' % len(body) + body)
+
+def test_render_and_malformed_requests():
+    body = json.dumps({'data': {'name': 'Ada'}, 'template': 'resume-style'}).encode()
+    replies = asyncio.run(exchange([
+        post(b'/render', body),
+        b'POST /render HTTP/1.1\r\nContent-Length: abc\r\n\r\n',
+        b'POST /render HTTP/1.1\r\nContent-Length: -5\r\n\r\n',
+        b'GET /healthz HTTP/1.1\r\nX-Big: ' + b'a' * 70000 + b'\r\n\r\n',
+        b'GET /' + b'a' * 70000 + b' HTTP/1.1\r\n\r\n',
+        post(b'/render', b'{x}'),
+        b'POST /qr HTTP/1.1\r\nContent-Length: 99999999\r\n\r\n',
+    ]))
+    assert replies[0][0] == 'HTTP/1.1 200 OK' and replies[0][1].startswith(b'# Ada')
+    assert [status for status, _ in replies[1:]] == [
+        'HTTP/1.1 400 Bad Request', 'HTTP/1.1 400 Bad Request',
+        'HTTP/1.1 431 Request Header Fields Too Large', 'HTTP/1.1 431 Request Header Fields Too Large',
+        'HTTP/1.1 400 Bad Request', 'HTTP/1.1 413 Payload Too Large']
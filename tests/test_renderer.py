@@ -0,0 +1,105 @@
+import copy
+import random
+
+import pytest
+
+import legacy_renderer
+from renderer import QR_FILENAME, TEMPLATES, clear_caches, generate_markdown
+
+# values == can't tell apart (8 == 8.0 == True) or that old fingerprints
+# mixed up (None / 'None', 5 / '5', ['a'] / "['a']")
+SCALARS = ['', 'x', 'None', None, '5', 5, 8, 8.0, True, 'BSc', "['a']"]
+TEXT = ['', 'Ada', 'None', None, '5', 5, 8, 8.0, True, 'A & B', "['a']"]
+PROJECT_NAMES = ['Alpha', 'None', None, 5, '5']
+LINK_LISTS = [[], ['https://a.example'], [' ', 'https://b.example'], ['https://a.example', 'https://b.example']]
+
+def random_project(rng):
+    return {'name': rng.choice(PROJECT_NAMES), 'links': list(rng.choice(LINK_LISTS)),
+            'tags': rng.choice(['', 'web', 'None', 5]), 'desc': rng.choice(['', 'does things', None, 8.0])}
+
+def random_edit(rng, data):
+    # one in-place or replacing edit, like the app's widgets and batch files make
+    field = rng.choice(['name', 'title', 'about', 'education', 'cpi', 'phone', 'email', 'linkedin', 'github',
+                        'objective', 'socials', 'tech', 'certifications', 'projects', 'projects', 'projects'])
+    if field == 'cpi':
+        data['cpi'] = rng.choice(SCALARS)
+    elif field == 'github':
+        data['github'] = rng.choice(['', 'https://github.com/ada', 'https://github.com/ada/', None])
+    elif field == 'socials':
+        data['socials'] = [{'label': rng.choice(['GitHub', 'LinkedIn', 'Email', 'instagram']),
+                            'url': rng.choice(['', 'https://x.example', 'ada@example.com'])}
+                           for _ in range(rng.randint(0, 3))]
+    elif field == 'tech':
+        data['tech'] = rng.sample(['Python', 'C++', 'Go', 'None', 'Rust'], rng.randint(0, 4))
+    elif field == 'certifications':
+        data['certifications'] = rng.sample(['AWS', 'None', 'CKA', '5'], rng.randint(0, 3))
+    elif field == 'projects':
+        projects = data.setdefault('projects', [])
+        op = rng.choice(['add', 'edit', 'edit', 'remove', 'swap'])
+        if op == 'add' or not projects:
+            projects.append(random_project(rng))
+        elif op == 'edit':
+            # edit in place, as the project editor does
+            p = rng.choice(projects)
+            key = rng.choice(['name', 'tags', 'desc', 'links'])
+            if key == 'links':
+                p['links'].append(rng.choice(['https://c.example', ' ']))
+            else:
+                p[key] = random_project(rng)[key]
+        elif op == 'remove':
+            projects.pop(rng.randrange(len(projects)))
+        elif len(projects) > 1:
+            i, j = rng.sample(range(len(projects)), 2)
+            projects[i], projects[j] = projects[j], projects[i]
+    else:
+        data[field] = rng.choice(TEXT)
+
+def check(data, template, include_qr=False):
+    # same output as the if-chain, or an error where it raised one too
+    try:
+        expected = legacy_renderer.generate_markdown(data, template, include_qr, QR_FILENAME)
+    except (TypeError, AttributeError):
+        with pytest.raises((TypeError, AttributeError)):
+            generate_markdown(data, template, include_qr, QR_FILENAME)
+        return False
+    assert generate_markdown(data, template, include_qr, QR_FILENAME) == expected, data
+    return True
+
+@pytest.fixture(autouse=True)
+def cold_sections():
+    clear_caches()
+    yield
+
+@pytest.mark.parametrize('template', TEMPLATES)
+def test_matches_legacy_across_edits(template):
+    rng = random.Random(template)
+    data = {}
+    compared = 0
+    for step in range(1500):
+        before = copy.deepcopy(data)
+        random_edit(rng, data)
+        if check(data, template, include_qr=step % 7 == 0):
+            compared += 1
+        else:
+            data = before  # keep editing a profile both can render
+    assert compared > 1000
+
+@pytest.mark.parametrize('template', TEMPLATES)
+@pytest.mark.parametrize('sequence', [
+    [{'title': 'None'}, {'title': 'x'}, {'title': None}],
+    [{'about': '5'}, {'about': 5}],
+    [{'education': 'BSc', 'cpi': 8.0}, {'education': 'BSc', 'cpi': 8}, {'education': 'BSc', 'cpi': True}],
+    [{'projects': [{'name': 'A', 'desc': 8.0}]}, {'projects': [{'name': 'A', 'desc': 8}]}],
+    [{'projects': [{'name': 1, 'links': []}]}, {'projects': [{'name': True, 'links': []}]}],
+    [{'tech': ["['a']"]}, {'tech': ['a']}],
+])
+def test_values_equal_by_eq_render_differently(template, sequence):
+    for data in sequence:
+        check(data, template)
+
+def test_in_place_edits_are_seen():
+    data = {'projects': [{'name': 'A', 'links': ['https://a.example'], 'tags': '', 'desc': 'one'}]}
+    generate_markdown(data, 'clean-minimal')
+    data['projects'][0]['desc'] = 'two'
+    data['projects'][0]['links'].append('https://b.example')
+    assert check(data, 'clean-minimal')